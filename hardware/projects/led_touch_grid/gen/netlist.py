@@ -159,32 +159,35 @@ class NetlistGenerator:
         self.categorize_nets(nets)
         self.validate_net_connectivity(nets)
 
-        # Generate netlist header
-        netlist = f"(netlist (version 20240101) (source {self.project_name})\n"
+        # Generate netlist header; sections are collected as parts and joined
+        # once rather than re-concatenating the growing string per line.
+        parts = [f"(netlist (version 20240101) (source {self.project_name})\n"]
 
         # Generate component section
-        netlist += "  (components\n"
+        parts.append("  (components\n")
         for comp in components:
-            netlist += f'    (comp (ref "{comp["reference"]}") (value "{comp["value"]}") '
-            netlist += f'(footprint "{comp["footprint"]}") (lib "{comp["library"]}"))\n'
-        netlist += "  )\n"
+            parts.append(
+                f'    (comp (ref "{comp["reference"]}") (value "{comp["value"]}") '
+                f'(footprint "{comp["footprint"]}") (lib "{comp["library"]}"))\n'
+            )
+        parts.append("  )\n")
 
         # Generate net section
-        netlist += "  (nets\n"
+        parts.append("  (nets\n")
         for net_name, connections in nets.items():
-            netlist += f'    (net (name "{net_name}") (num {len(self.nets[net_name]) + 1})\n'
+            parts.append(f'    (net (name "{net_name}") (num {len(self.nets[net_name]) + 1})\n')
             for connection in connections:
                 try:
                     ref, pin = connection.split(".", 1)
-                    netlist += f'      (node (ref "{ref}") (pin "{pin}"))\n'
+                    parts.append(f'      (node (ref "{ref}") (pin "{pin}"))\n')
                 except ValueError:
                     print(f"WARNING: Skipping invalid connection - {connection}")
-            netlist += "    )\n"
-        netlist += "  )\n"
+            parts.append("    )\n")
+        parts.append("  )\n")
 
-        netlist += ")"
+        parts.append(")")
 
-        return netlist
+        return "".join(parts)
 
     def generate_statistics_report(self) -> str:
         """Generate netlist statistics report."""
@@ -9,6 +9,7 @@ from src.services.validation_engine import ValidationError, validate_project_con
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="kb-validate")
     parser.add_argument("--config", required=True, help="Path to project config JSON")
+    parser.add_argument("--strict", action="store_true", help="Also require a known project_type")
     args = parser.parse_args(argv)
 
     try:
@@ -18,7 +19,7 @@ def main(argv: list[str] | None = None) -> int:
         return 2
 
     try:
-        validate_project_config(cfg)
+        validate_project_config(cfg, strict=args.strict)
         print("VALID")
         return 0
     except ValidationError as exc:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import importlib
 import importlib.util
 import json
+import re
 import subprocess
 import sys
 import traceback
@@ -16,6 +18,11 @@ from typing import Any, Dict, Iterable, List, Optional
 # Preflight import timeout (seconds) when checking modules in a subprocess
 PREFLIGHT_IMPORT_TIMEOUT = 5
 
+# Plugin files at most this many bytes are screened for the trivial
+# single-statement `from pkg.mod import GENERATOR` re-export pattern.
+_REEXPORT_SCAN_BYTES = 1024
+_REEXPORT_RE = re.compile(rb"\A\s*from\s+([A-Za-z_][\w.]*)\s+import\s+GENERATOR\s*\Z")
+
 
 class AutoRegisterError(RuntimeError):
     """Raised when auto-registration finds one or more problems.
@@ -47,6 +54,37 @@ def _module_name_for_path(path: Path) -> str:
     return path.stem
 
 
+def _load_reexport(path: Path, module_name: str) -> Optional[ModuleType]:
+    """Load a plugin that only re-exports GENERATOR without executing it.
+
+    Returns a lightweight module carrying the resolved `GENERATOR` when the
+    file consists solely of `from <module> import GENERATOR`; returns None
+    (so callers fall back to a full import) for anything else or when the
+    target cannot be imported. Call only after the plugin passed the
+    preflight import, which guards the target against hangs and exits.
+    """
+    try:
+        with path.open("rb") as fh:
+            head = fh.read(_REEXPORT_SCAN_BYTES + 1)
+    except OSError:
+        return None
+    if len(head) > _REEXPORT_SCAN_BYTES:
+        return None
+    m = _REEXPORT_RE.match(head)
+    if m is None:
+        return None
+    try:
+        target = importlib.import_module(m.group(1).decode("ascii"))
+        generator = getattr(target, "GENERATOR")
+    except Exception:
+        return None
+    mod = ModuleType(module_name)
+    mod.__file__ = str(path)
+    setattr(mod, "GENERATOR", generator)
+    sys.modules[module_name] = mod
+    return mod
+
+
 def _load_module_from_path(
     path: Path,
 ) -> tuple[Optional[ModuleType], Optional[str]]:
@@ -65,6 +103,12 @@ def _load_module_from_path(
     if preflight_err is not None:
         return None, preflight_err
 
+    # Once the preflight has imported it safely, a plain GENERATOR re-export
+    # needs no spec/loader machinery; resolve the target module directly.
+    reexport = _load_reexport(path, module_name)
+    if reexport is not None:
+        return reexport, None
+
     try:
         spec = importlib.util.spec_from_file_location(module_name, str(path))
         if spec is None or spec.loader is None:
@@ -203,8 +247,6 @@ def auto_register_generators(
                 entry["traceback"] = tb
                 # try to extract a lineno and a code snippet from tb
                 try:
-                    import re
-
                     m = re.search(
                         r"File \"(?P<file>.+?)\", line (?P<line>\d+)",
                         tb,
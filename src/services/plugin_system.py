@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 from pathlib import Path
 from types import ModuleType
@@ -9,13 +10,13 @@ from typing import List
 
 def discover(plugins_dir: Path) -> List[Path]:
     """Return python files in the plugins_dir (non-recursive)."""
-    if not plugins_dir.exists():
+    # A single scandir both checks for the directory and lists it; the
+    # directory usually exists so EAFP avoids a separate stat call.
+    try:
+        with os.scandir(plugins_dir) as it:
+            return [Path(e.path) for e in it if e.name.endswith(".py") and e.is_file()]
+    except FileNotFoundError:
         return []
-    files = []
-    for p in plugins_dir.iterdir():
-        if p.suffix == ".py" and p.is_file():
-            files.append(p)
-    return files
 
 
 def load(path: Path) -> ModuleType:
@@ -24,9 +25,7 @@ def load(path: Path) -> ModuleType:
     if spec is None or spec.loader is None:
         raise ImportError(f"cannot create spec for {path}")
     mod = importlib.util.module_from_spec(spec)
-    loader = spec.loader
-    assert loader is not None
-    loader.exec_module(mod)
+    spec.loader.exec_module(mod)
     # Ensure module is importable by name in sys.modules
     sys.modules[mod.__name__] = mod
     return mod
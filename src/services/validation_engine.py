@@ -1,25 +1,63 @@
 from __future__ import annotations
 
+import importlib
+import importlib.util
+import json
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from src.models.project_config import ProjectConfig
 
-try:
-    import jsonschema
-except Exception:  # pragma: no cover - optional dependency
-    jsonschema = None
+# Resolve the optional dependency once at import time. Only a missing
+# package disables rule checks; a broken install still surfaces its error.
+jsonschema: Any = importlib.import_module("jsonschema") if importlib.util.find_spec("jsonschema") is not None else None
+_HAS_JSONSCHEMA: bool = jsonschema is not None
+
+
+# Project types known to this repo. Checked in strict mode (kb-validate
+# --strict) when no rules are supplied.
+VALID_PROJECT_TYPES: frozenset[str] = frozenset({"simple", "template", "hier"})
 
 
 class ValidationError(Exception):
     """Raised when validation fails."""
 
 
-def validate_project_config(config: ProjectConfig, rules: Optional[List[Dict[str, Any]]] = None) -> bool:
+def _rule_key(rule: Dict[str, Any]) -> str:
+    """Return the canonical JSON text of a JSON Schema fragment."""
+    return json.dumps(rule, sort_keys=True, default=str)
+
+
+@lru_cache(maxsize=128)
+def _validator_for_key(key: str) -> Any:
+    """Return a jsonschema validator for the canonical rule text `key`."""
+    rule = json.loads(key)
+    cls = jsonschema.validators.validator_for(rule)
+    cls.check_schema(rule)
+    return cls(rule)
+
+
+def _compiled_validator(rule: Dict[str, Any]) -> Any:
+    """Return a (cached) jsonschema validator instance for `rule`.
+
+    Validators are keyed by the rule's canonical JSON, so callers passing
+    freshly built (but equal) rule dicts still hit the bounded cache.
+    """
+    return _validator_for_key(_rule_key(rule))
+
+
+def validate_project_config(
+    config: ProjectConfig,
+    rules: Optional[List[Dict[str, Any]]] = None,
+    *,
+    strict: bool = False,
+) -> bool:
     """Validate a ProjectConfig.
 
     If `rules` (a list of JSON Schema fragments) are provided and
     `jsonschema` is available, validate against them. Otherwise perform
-    basic required-field checks. Returns True on success or raises
+    basic required-field checks; with `strict=True` the project_type must
+    also be one of VALID_PROJECT_TYPES. Returns True on success or raises
     ValidationError on failure.
     """
     # Basic required checks via Pydantic: ensure instance type
@@ -28,21 +66,29 @@ def validate_project_config(config: ProjectConfig, rules: Optional[List[Dict[str
 
     if not rules:
         # minimal sanity checks
-        if not getattr(config, "project_name", None):
+        if not config.project_name:
             raise ValidationError("project_name is required")
-        if not getattr(config, "project_type", None):
+        if not config.project_type:
             raise ValidationError("project_type is required")
+        if strict and config.project_type not in VALID_PROJECT_TYPES:
+            raise ValidationError(f"unknown project_type: {config.project_type}")
         return True
 
-    if jsonschema is None:
+    if not _HAS_JSONSCHEMA:
         # Can't run rule-based checks without jsonschema.
         raise ValidationError("jsonschema not available to validate rules")
 
-    # Validate using provided jsonschema rules
+    # Validate using provided jsonschema rules. `is_valid` stops at the
+    # first error, so the full error tree is only built for failing rules.
+    instance = config.model_dump()
     for idx, rule in enumerate(rules):
         try:
-            jsonschema.validate(instance=config.model_dump(), schema=rule)
+            validator = _compiled_validator(rule)
         except Exception as exc:
             raise ValidationError(f"rule {idx} failed: {exc}") from exc
+        if validator.is_valid(instance):
+            continue
+        error = jsonschema.exceptions.best_match(validator.iter_errors(instance))
+        raise ValidationError(f"rule {idx} failed: {error}") from error
 
     return True
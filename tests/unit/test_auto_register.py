@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 from src.lib import generator_registry as registry
@@ -36,3 +37,44 @@ def test_auto_register_happy_and_failure(tmp_path: Path):
     # At least one registered generator should be the template
     names = registry.list_generators()
     assert any("template" in n for n in names)
+
+
+def test_reexport_plugin_skips_full_import(tmp_path: Path):
+    plugin = tmp_path / "reexport_plugin.py"
+    plugin.write_text("from src.lib.generators.template_generator import GENERATOR\n", encoding="utf8")
+
+    mod, tb = auto_register._load_module_from_path(plugin)
+    assert tb is None
+    from src.lib.generators.template_generator import GENERATOR
+
+    assert mod is not None and mod.GENERATOR is GENERATOR
+
+    # anything beyond the bare re-export falls back to the full loader
+    other = tmp_path / "other_plugin.py"
+    other.write_text("from src.lib.generators.template_generator import GENERATOR\nX = 1\n", encoding="utf8")
+    assert auto_register._load_reexport(other, "other_plugin") is None
+
+
+def test_reexport_of_hanging_or_exiting_module_stays_in_preflight(tmp_path: Path, monkeypatch):
+    # The re-export targets live in tmp_path; the preflight subprocess finds
+    # them through PYTHONPATH and the host through sys.path.
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    monkeypatch.setattr(auto_register, "PREFLIGHT_IMPORT_TIMEOUT", 2)
+
+    (tmp_path / "reexport_exits_target.py").write_text("import sys\nsys.exit(3)\n", encoding="utf8")
+    (tmp_path / "reexport_hangs_target.py").write_text("import time\ntime.sleep(60)\n", encoding="utf8")
+    exits = tmp_path / "exits_plugin.py"
+    exits.write_text("from reexport_exits_target import GENERATOR\n", encoding="utf8")
+    hangs = tmp_path / "hangs_plugin.py"
+    hangs.write_text("from reexport_hangs_target import GENERATOR\n", encoding="utf8")
+
+    mod, tb = auto_register._load_module_from_path(exits)
+    assert mod is None and tb is not None
+
+    mod, tb = auto_register._load_module_from_path(hangs)
+    assert mod is None and tb == "timeout after 2s"
+
+    # Neither target was ever imported into the host process
+    assert "reexport_exits_target" not in sys.modules
+    assert "reexport_hangs_target" not in sys.modules
@@ -1,3 +1,5 @@
+import pytest
+
 from src.models.project_config import ProjectConfig
 from src.services import validation_engine
 
@@ -15,3 +17,50 @@ def test_validate_project_config_missing_name():
     except validation_engine.ValidationError:
         raised = True
     assert raised
+
+
+def test_validate_project_config_rules_cached_by_content():
+    pytest.importorskip("jsonschema")
+    cfg = ProjectConfig(project_name="n", project_type="t")
+    rule = {"type": "object", "required": ["project_name"]}
+    validation_engine._validator_for_key.cache_clear()
+    assert validation_engine.validate_project_config(cfg, rules=[rule]) is True
+    # An equal but distinct rule dict reuses the compiled validator.
+    assert validation_engine.validate_project_config(cfg, rules=[dict(rule)]) is True
+    info = validation_engine._validator_for_key.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert info.maxsize is not None
+
+    with pytest.raises(validation_engine.ValidationError):
+        validation_engine.validate_project_config(cfg, rules=[{"required": ["missing"]}])
+
+
+def test_validate_project_config_strict_project_type():
+    cfg = ProjectConfig(project_name="n", project_type="simple")
+    assert validation_engine.validate_project_config(cfg, strict=True) is True
+
+    unknown = ProjectConfig(project_name="n", project_type="nope")
+    assert validation_engine.validate_project_config(unknown) is True
+    with pytest.raises(validation_engine.ValidationError):
+        validation_engine.validate_project_config(unknown, strict=True)
+
+
+def test_validate_project_config_strict_fixture_types(monkeypatch):
+    # Fixture-only ids are not built in; tests register them on the set
+    fixture = ProjectConfig(project_name="n", project_type="test")
+    with pytest.raises(validation_engine.ValidationError):
+        validation_engine.validate_project_config(fixture, strict=True)
+    monkeypatch.setattr(
+        validation_engine, "VALID_PROJECT_TYPES", validation_engine.VALID_PROJECT_TYPES | {"test", "vendor:example"}
+    )
+    assert validation_engine.validate_project_config(fixture, strict=True) is True
+
+
+def test_validate_cli_strict_flag(tmp_path, capsys):
+    from src.cli import validate
+
+    cfg = tmp_path / "cfg.json"
+    cfg.write_text('{"project_name": "n", "project_type": "nope"}', encoding="utf8")
+    assert validate.main(["--config", str(cfg)]) == 0
+    assert validate.main(["--config", str(cfg), "--strict"]) == 2
+    assert "INVALID: unknown project_type: nope" in capsys.readouterr().out
@@ -8,10 +8,26 @@ major failures.
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import importlib
+import importlib.util
+import io
+import json
 import os
 import shutil
+import site
 import subprocess
 import sys
+import sysconfig
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Seconds a cached report (see BUTTONS_ENV_CACHE) stays valid.
+ENV_CACHE_TTL = 60.0
+# Environment variables that can change the report; part of the cache key.
+_CACHE_KEY_ENVVARS = ("PATH", "VIRTUAL_ENV", "PYTHONPATH", "BUTTONS_IGNORE_PYTHON_CHECK")
 
 
 def check_python(min_major: int = 3, min_minor: int = 11) -> bool:
@@ -23,8 +39,16 @@ def check_python(min_major: int = 3, min_minor: int = 11) -> bool:
 
 
 def check_module(name: str) -> bool:
+    """Report whether `name` imports, and its ``__version__`` if it has one.
+
+    find_spec() skips the import attempt for modules that are not installed
+    at all; installed ones are really imported, so a broken install or a
+    missing shared library is still reported as MISSING.
+    """
     try:
-        m = __import__(name)
+        if importlib.util.find_spec(name) is None:
+            raise ModuleNotFoundError(name)
+        m = importlib.import_module(name)
         ver = getattr(m, "__version__", None)
         print(f"module: {name} present (version={ver})")
         return True
@@ -33,11 +57,11 @@ def check_module(name: str) -> bool:
         return False
 
 
-def run_cmd(cmd: list[str]) -> str | None:
+def _probe_cmd(cmd: list[str]) -> tuple[str | None, list[str]]:
+    """Run `cmd` and return (output, report lines) without printing."""
     exe = shutil.which(cmd[0])
     if not exe:
-        print(f"cmd: {cmd[0]} not found in PATH")
-        return None
+        return None, [f"cmd: {cmd[0]} not found in PATH"]
     try:
         # Use subprocess.run with a short timeout to avoid launching GUI apps
         # that may not exit (macOS KiCad binary can open a GUI and block).
@@ -50,38 +74,56 @@ def run_cmd(cmd: list[str]) -> str | None:
         )
         out = proc.stdout or ""
         first = out.splitlines()[0] if out else ""
-        print(f"cmd: {' '.join(cmd)} -> {first}")
+        lines = [f"cmd: {' '.join(cmd)} -> {first}"]
         if proc.returncode != 0:
-            print(f"cmd: {' '.join(cmd)} -> exit {proc.returncode}")
-        return out
+            lines.append(f"cmd: {' '.join(cmd)} -> exit {proc.returncode}")
+        return out, lines
     except subprocess.TimeoutExpired:
-        print(f"cmd: {' '.join(cmd)} -> timed out")
-        return None
+        return None, [f"cmd: {' '.join(cmd)} -> timed out"]
     except subprocess.CalledProcessError as e:
-        print(f"cmd: {' '.join(cmd)} -> error (exit {e.returncode})")
-        return None
+        return None, [f"cmd: {' '.join(cmd)} -> error (exit {e.returncode})"]
 
 
-def git_sha_short() -> str | None:
+def _probe_git() -> tuple[str | None, list[str]]:
+    """Return (short HEAD sha, report lines) without printing."""
     try:
         out = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
-        print(f"git: HEAD {out}")
-        return out
+        return out, [f"git: HEAD {out}"]
     except Exception:
-        print("git: not available or not a git repo")
-        return None
+        return None, ["git: not available or not a git repo"]
 
 
-def main() -> int:
-    """Run checks and return an exit code.
+def _report(result: tuple[str | None, list[str]]) -> str | None:
+    value, lines = result
+    for line in lines:
+        print(line)
+    return value
 
-    If the environment variable BUTTONS_IGNORE_PYTHON_CHECK is set the
-    Python-version mismatch will be allowed (useful for continuing work on
-    systems where upgrading Python is not possible right now).
-    """
+
+def run_cmd(cmd: list[str]) -> str | None:
+    return _report(_probe_cmd(cmd))
+
+
+def git_sha_short() -> str | None:
+    return _report(_probe_git())
+
+
+def _run_checks() -> int:
     print("== buttons: environment check ==")
     ok = True
 
+    # The external tool probes are independent subprocesses; start them up
+    # front so they overlap each other and the module checks below. Results
+    # are reported in a fixed order once everything else has run.
+    pool = ThreadPoolExecutor(max_workers=3)
+    # Prefer the CLI interface and avoid flags that may launch the GUI.
+    probes = [
+        pool.submit(_probe_cmd, ["kicad-cli", "--version"]),
+        pool.submit(_probe_cmd, ["kicad", "--version"]),
+        pool.submit(_probe_git),
+    ]
+    pool.shutdown(wait=False)
+
     ignore_py = os.environ.get("BUTTONS_IGNORE_PYTHON_CHECK")
     if ignore_py:
         print("BUTTONS_IGNORE_PYTHON_CHECK set; skipping Python version failure")
@@ -92,12 +134,121 @@ def main() -> int:
     ok &= check_module("skidl")
     ok &= check_module("pytest")
     ok &= check_module("jinja2")
-    # Prefer the CLI interface and avoid flags that may launch the GUI.
-    run_cmd(["kicad-cli", "--version"])
-    run_cmd(["kicad", "--version"])
-    git_sha_short()
+    for fut in probes:
+        _report(fut.result())
     return 0 if ok else 2
 
 
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _git_head_stamp(start: Path) -> list[object]:
+    """Return HEAD's contents and ref-file mtimes for the repo holding `start`.
+
+    Any commit, checkout or reset rewrites one of these files, so a cached
+    report never shows a stale git SHA.
+    """
+    for d in (start, *start.parents):
+        git_dir = d / ".git"
+        if git_dir.exists():
+            break
+    else:
+        return []
+    if git_dir.is_file():
+        # Worktrees and submodules: `.git` holds "gitdir: <path>"
+        text = git_dir.read_text(encoding="utf8").strip()
+        git_dir = d / text.removeprefix("gitdir:").strip()
+    common_dir = git_dir
+    if (git_dir / "commondir").is_file():
+        common_dir = git_dir / (git_dir / "commondir").read_text(encoding="utf8").strip()
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf8").strip()
+    except OSError:
+        return []
+    paths = [git_dir / "HEAD", common_dir / "packed-refs"]
+    if head.startswith("ref:"):
+        paths.append(common_dir / head.removeprefix("ref:").strip())
+    return [head, *(_mtime_ns(p) for p in paths)]
+
+
+def _site_packages_dirs() -> list[Path]:
+    """Return the directories packages are installed into for this interpreter."""
+    paths = sysconfig.get_paths()
+    dirs = {paths["purelib"], paths["platlib"], site.getusersitepackages()}
+    return [Path(d) for d in sorted(dirs)]
+
+
+def _cache_file(cache_dir: str) -> Path:
+    """Return the cache file for the current interpreter, cwd, env and state.
+
+    Besides the interpreter, cwd and env vars, the key covers the git HEAD
+    (contents and ref mtimes) and the site-packages directory mtimes, so a
+    new commit or an installed/removed package starts a fresh report.
+    """
+    cwd = os.getcwd()
+    key = json.dumps(
+        [
+            sys.executable,
+            cwd,
+            {v: os.environ.get(v) for v in _CACHE_KEY_ENVVARS},
+            _git_head_stamp(Path(cwd)),
+            [[str(d), _mtime_ns(d)] for d in _site_packages_dirs()],
+        ],
+        sort_keys=True,
+    )
+    digest = hashlib.sha256(key.encode("utf8")).hexdigest()[:16]
+    return Path(cache_dir) / f"buttons_env_check_{digest}.json"
+
+
+def _read_cache(path: Path) -> tuple[str, int] | None:
+    try:
+        if time.time() - path.stat().st_mtime > ENV_CACHE_TTL:
+            return None
+        data = json.loads(path.read_text(encoding="utf8"))
+        return str(data["output"]), int(data["exit_code"])
+    except Exception:
+        return None
+
+
+def main() -> int:
+    """Run checks and return an exit code.
+
+    If the environment variable BUTTONS_IGNORE_PYTHON_CHECK is set the
+    Python-version mismatch will be allowed (useful for continuing work on
+    systems where upgrading Python is not possible right now).
+
+    If BUTTONS_ENV_CACHE names a directory, the report and exit code are
+    cached there for ENV_CACHE_TTL seconds so repeated CI stages reuse one
+    run. The cache is keyed on the interpreter, cwd, relevant env vars, the
+    git HEAD and the site-packages directories.
+    """
+    cache_dir = os.environ.get("BUTTONS_ENV_CACHE")
+    if not cache_dir:
+        return _run_checks()
+
+    cache_file = _cache_file(cache_dir)
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        output, code = cached
+        sys.stdout.write(output)
+        return code
+
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        code = _run_checks()
+    output = buf.getvalue()
+    sys.stdout.write(output)
+    try:
+        cache_file.write_text(json.dumps({"output": output, "exit_code": code}), encoding="utf8")
+    except OSError:
+        # Caching is best-effort; an unwritable dir just means no reuse.
+        pass
+    return code
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
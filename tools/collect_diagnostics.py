@@ -9,12 +9,53 @@ This is intended to be used in CI to fail early and provide a concise report.
 from __future__ import annotations
 
 import json
+import os
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
-def find_diagnostics(root: Path) -> List[Path]:
-    return list(root.glob("**/auto_register_diagnostics.json"))
+DIAGNOSTICS_NAME = "auto_register_diagnostics.json"
+
+# Directory names never searched for diagnostics (VCS data, virtualenvs and
+# tool caches can be large and never hold our output).
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+
+
+def find_diagnostics(root: Path) -> Iterator[Path]:
+    """Yield diagnostics files under `root`, pruning SKIP_DIRS subtrees."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        if DIAGNOSTICS_NAME in filenames:
+            yield Path(dirpath) / DIAGNOSTICS_NAME
+
+
+def _type_key(item: Any) -> str:
+    if not isinstance(item, dict):
+        return "unknown"
+    key = item.get("type", "unknown")
+    return key if isinstance(key, str) else str(key)
+
+
+def _count_types(items: Iterable[Any]) -> Dict[str, int]:
+    return dict(Counter(map(_type_key, items)))
 
 
 def summarize(path: Path) -> Dict[str, Any]:
@@ -22,41 +63,36 @@ def summarize(path: Path) -> Dict[str, Any]:
 
     Returns a dict with the file path and either an "error" key on
     read/parse failure or a "failures" mapping of failure-type -> count.
+    When `ijson` is installed the top-level array is decoded one record at
+    a time so large files are never held in memory as a whole.
     """
-    text = path.read_text(encoding="utf8")
     try:
-        data = json.loads(text)
+        with path.open("rb") as fh:
+            if ijson is not None:
+                counts = _count_types(ijson.items(fh, "item", use_float=True))
+            else:
+                data = json.load(fh)
+                counts = _count_types(data) if isinstance(data, list) else {}
     except Exception as exc:
         return {"path": str(path), "error": f"read_error: {exc}"}
 
-    counts: Dict[str, int] = {}
-    if isinstance(data, list):
-        for item in data:
-            if not isinstance(item, dict):
-                key = "unknown"
-            else:
-                key = item.get("type", "unknown")
-                if not isinstance(key, str):
-                    key = str(key)
-            counts[key] = counts.get(key, 0) + 1
-
     return {"path": str(path), "failures": counts}
 
 
 def main() -> int:
     root = Path.cwd()
-    found = find_diagnostics(root)
-    if not found:
-        print("No auto-register diagnostics found.")
-        return 0
-
-    print("Found auto-register diagnostics:")
-    any_summary = []
-    for p in found:
+    any_summary: list[dict[str, Any]] = []
+    for p in find_diagnostics(root):
+        if not any_summary:
+            print("Found auto-register diagnostics:")
         s = summarize(p)
         any_summary.append(s)
         print(json.dumps(s, indent=2))
 
+    if not any_summary:
+        print("No auto-register diagnostics found.")
+        return 0
+
     print()
     print("CI Note: auto-register diagnostics were found; failing the build.")
     return 1
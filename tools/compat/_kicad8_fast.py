@@ -0,0 +1,88 @@
+"""Pure S-expression walking used by the kicad8 adapter.
+
+Kept free of SKiDL imports so the unit/pin extraction can be exercised on
+plain nested lists, separately from the SKiDL objects built from it.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# (func key, name, number, x, y, angle, length) for one `pin` node.
+PinSpec = Tuple[str, Any, Any, Any, Any, Any, Any]
+
+
+def token(node: List[Any]) -> str:
+    """Return the lowercased head token of an S-expression node."""
+    head = node[0]
+    return head.lower() if isinstance(head, str) else str(head).lower()
+
+
+def _as_list(item: Any) -> List[Any]:
+    if isinstance(item, (list, tuple)):
+        return list(item)
+    return [item]
+
+
+def parse_pin(pin: List[Any]) -> PinSpec:
+    """Extract the fields of a `pin` node; raises on malformed children."""
+    func_key = str(pin[1]).lower() if len(pin) > 1 else "unspecified"
+    # Index child nodes by token once; later duplicates win, as they would
+    # when scanning sequentially.
+    fields: Dict[str, List[Any]] = {}
+    for child in pin:
+        item = _as_list(child)
+        if item:
+            fields[token(item)] = item
+    name: Any = fields["name"][1] if "name" in fields else ""
+    number: Any = fields["number"][1] if "number" in fields else None
+    length: Any = fields["length"][1] if "length" in fields else None
+    x: Any = 0
+    y: Any = 0
+    angle: Any = 0
+    at = fields.get("at")
+    if at is not None and len(at) >= 4:
+        x, y, angle = at[1], at[2], at[3]
+    return (func_key, name, number, x, y, angle, length)
+
+
+def parse_units(part_defn: List[Any]) -> Optional[List[Tuple[int, List[PinSpec]]]]:
+    """Return (unit number, pins) for each nested `symbol` unit.
+
+    Unit numbers come from names ending in ``_<major>_<minor>``. Returns
+    None when `part_defn` has no nested symbols at all. Units whose name
+    cannot be parsed, the pin-less global unit 0, and malformed pins are
+    skipped.
+    """
+    units = [u for u in part_defn if isinstance(u, list) and u and token(u) == "symbol"]
+    if not units:
+        return None
+
+    result: List[Tuple[int, List[PinSpec]]] = []
+    for unit in units:
+        try:
+            # Expect something like 'RP2040_0_0' -> take last two parts
+            name_parts = str(unit[1]).split("_")
+            if len(name_parts) < 2:
+                continue
+            major = int(name_parts[-2])
+        except Exception:
+            continue
+
+        pin_nodes = [
+            item
+            for item in unit
+            if isinstance(item, list) and item and isinstance(item[0], str) and token(item) == "pin"
+        ]
+        if not pin_nodes and major == 0:
+            # Skip global unit without pins
+            continue
+
+        pins: List[PinSpec] = []
+        for pin in pin_nodes:
+            try:
+                pins.append(parse_pin(pin))
+            except Exception:
+                continue
+        result.append((major, pins))
+    return result
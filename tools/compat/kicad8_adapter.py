@@ -10,8 +10,138 @@ This is a non-invasive, test-time shim intended to live in the repo
 so we don't have to edit site-packages permanently.
 """
 
+import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
+from ._kicad8_fast import parse_units
+
+_SYMBOL_SEARCH_PATH = "/kicad_symbol_lib/symbol"
+_SYMBOL_DIR_ENVVARS = ("KICAD8_SYMBOL_DIR", "KICAD_SYMBOL_DIR", "KICAD6_SYMBOL_DIR")
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=128)
+def _parse_sexp(path: str, mtime_ns: Optional[int]) -> Optional[Any]:
+    """Read and parse a `.kicad_sym` file; cached per (path, mtime)."""
+    from simp_sexp import Sexp
+
+    txt = None
+    for enc in ("utf-8", "latin-1"):
+        try:
+            with open(path, "r", encoding=enc) as fh:
+                txt = fh.read()
+            break
+        except Exception:
+            continue
+    if txt is None:
+        return None
+    try:
+        return Sexp(txt)
+    except Exception:
+        return None
+
+
+def _load_sexp(path: str) -> Optional[Any]:
+    """Return the parsed `.kicad_sym` file at `path`.
+
+    `path` should be absolute so the cache key is stable. The file's mtime
+    is part of the key, so an edited library is parsed again. Returns None
+    if the file cannot be read or parsed.
+    """
+    return _parse_sexp(path, _mtime_ns(path))
+
+
+@lru_cache(maxsize=512)
+def _find_symbol_at(path: str, mtime_ns: Optional[int], name: str) -> Optional[Any]:
+    from simp_sexp import Sexp
+
+    sexp = _parse_sexp(path, mtime_ns)
+    if sexp is None:
+        return None
+    for sym in sexp.search(_SYMBOL_SEARCH_PATH, ignore_case=True):
+        try:
+            if str(sym[1]) == name:
+                if not isinstance(sym, Sexp):
+                    sym = Sexp(sym)
+                return sym
+        except Exception:
+            continue
+    return None
+
+
+def _find_symbol(path: str, name: str) -> Optional[Any]:
+    """Return the top-level symbol node called `name` in `path`, or None."""
+    return _find_symbol_at(path, _mtime_ns(path), name)
+
+
+def _symbol_dirs() -> List[str]:
+    """Return the directories searched for `.kicad_sym` files, in order."""
+    dirs = [p for p in (os.environ.get(v) for v in _SYMBOL_DIR_ENVVARS) if p]
+    dirs.append(".")
+    return dirs
+
+
+@lru_cache(maxsize=16)
+def _scan_symbol_dirs(dirs: Tuple[Tuple[str, Optional[int]], ...]) -> Dict[str, str]:
+    """Map `.kicad_sym` file stems to absolute paths; cached per (dir, mtime) set."""
+    index: Dict[str, str] = {}
+    for base, _mtime in dirs:
+        try:
+            it = os.scandir(base)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                fn = entry.name
+                if fn.endswith(".kicad_sym"):
+                    index.setdefault(fn[: -len(".kicad_sym")], os.path.abspath(entry.path))
+    return index
+
+
+def _symbol_index(dirs: Tuple[str, ...]) -> Dict[str, str]:
+    """Map `.kicad_sym` file stems to absolute paths for the given dirs.
+
+    Scans are cached keyed by the absolute dirs and their mtimes, so a
+    changed env var or cwd, or a file added to or removed from a directory,
+    yields a fresh scan. Earlier directories win when the same stem appears
+    more than once. The returned dict is shared and must not be modified.
+    """
+    return _scan_symbol_dirs(tuple((d, _mtime_ns(d)) for d in dirs))
+
+
+def clear_caches() -> None:
+    """Drop every cached directory scan and parsed symbol library."""
+    _scan_symbol_dirs.cache_clear()
+    _find_symbol_at.cache_clear()
+    _parse_sexp.cache_clear()
+
+
+def _lookup_symbol(name: str) -> Optional[Any]:
+    """Find symbol `name` in `<name>*.kicad_sym` files.
+
+    An exact `<name>.kicad_sym` file is tried first, then any other file
+    whose name starts with `name`; the first file defining it wins.
+    """
+    index = _symbol_index(tuple(os.path.abspath(d) for d in _symbol_dirs()))
+    path = index.get(name)
+    if path is not None:
+        sym = _find_symbol(path, name)
+        if sym is not None:
+            return sym
+    for stem, path in index.items():
+        if stem != name and stem.startswith(name):
+            sym = _find_symbol(path, name)
+            if sym is not None:
+                return sym
+    return None
+
 
 def install() -> None:
     """Install the repo-local kicad8 adapter shim.
@@ -26,7 +156,7 @@ def install() -> None:
         from simp_sexp import Sexp
         from skidl import Pin
         from skidl.pin import pin_types
-        from skidl.utilities import num_to_chars, to_list
+        from skidl.utilities import num_to_chars
     except Exception:
         # Environment doesn't have SKiDL or Sexp; nothing to do.
         return
@@ -69,71 +199,22 @@ def install() -> None:
             except Exception:
                 return None
 
-            # Find nested 'symbol' entries.
-            units = []
-            for u in part_defn:
-                if isinstance(u, list) and u and str(u[0]).lower() == "symbol":
-                    units.append(u)
-            if not units:
+            # Walk the nested 'symbol' units and their pins (pure helper),
+            # then build SKiDL pins from the result.
+            units = parse_units(part_defn)
+            if units is None:
                 return None
 
             unit_nums: List[int] = []
-
-            for unit in units:
-                try:
-                    unit_name = unit[1]
-                    # Expect something like 'RP2040_0_0' -> take last two parts
-                    parts = str(unit_name).split("_")
-                    if len(parts) < 2:
-                        continue
-                    major = int(parts[-2])
-                except Exception:
-                    continue
-
-                # Collect immediate child 'pin' entries
-                pins = []
-                for item in unit:
-                    if isinstance(item, list) and item and isinstance(item[0], str) and item[0].lower() == "pin":
-                        pins.append(item)
-                if not pins and major == 0:
-                    # Skip global unit without pins
-                    continue
-
+            for major, pins in units:
                 unit_nums.append(major)
-
-                for pin in pins:
+                for func_key, pin_name, pin_number, pin_x, pin_y, pin_angle, pin_length in pins:
                     try:
-                        if len(pin) > 1:
-                            pin_func_key = str(pin[1]).lower()
-                        else:
-                            pin_func_key = "unspecified"
-                        pin_func = pin_io_type_translation.get(pin_func_key, pin_types.UNSPEC)
-                        pin_name = ""
-                        pin_number = None
-                        pin_x = pin_y = pin_angle = 0
-                        pin_length = None
-                        for item in pin:
-                            item = to_list(item)
-                            if not item:
-                                continue
-                            token_name = str(item[0]).lower()
-                            if token_name == "name":
-                                pin_name = item[1]
-                            elif token_name == "number":
-                                pin_number = item[1]
-                            elif token_name == "at":
-                                try:
-                                    pin_x, pin_y, pin_angle = item[1:4]
-                                except Exception:
-                                    pass
-                            elif token_name == "length":
-                                pin_length = item[1]
-
                         part.add_pins(
                             Pin(
                                 name=pin_name,
                                 num=pin_number,
-                                func=pin_func,
+                                func=pin_io_type_translation.get(func_key, pin_types.UNSPEC),
                                 unit=major,
                                 x=pin_x,
                                 y=pin_y,
@@ -184,57 +265,9 @@ def install() -> None:
 
                 # If still missing, search symbol files in common env dirs.
                 if not getattr(part, "part_defn", None):
-                    import os
-                    from glob import glob
-
-                    envvars = (
-                        "KICAD8_SYMBOL_DIR",
-                        "KICAD_SYMBOL_DIR",
-                        "KICAD6_SYMBOL_DIR",
-                    )
-
-                    candidates = []
-                    for envvar in envvars:
-                        p = os.environ.get(envvar)
-                        if p:
-                            candidates.append(p)
-                    candidates.append(".")
-
-                    search_path = "/kicad_symbol_lib/symbol"
-                    for base in candidates:
-                        try:
-                            fname = part._name + "*.kicad_sym"
-                            pattern = os.path.join(base, fname)
-                            for path in glob(pattern):
-                                try:
-                                    enc = "utf-8"
-                                    with open(path, "r", encoding=enc) as fh:
-                                        txt = fh.read()
-                                except Exception:
-                                    try:
-                                        enc = "latin-1"
-                                        with open(path, "r", encoding=enc) as fh:
-                                            txt = fh.read()
-                                    except Exception:
-                                        continue
-                                try:
-                                    sexp = Sexp(txt)
-                                except Exception:
-                                    continue
-                                sp = search_path
-                                for sym in sexp.search(sp, ignore_case=True):
-                                    try:
-                                        if str(sym[1]) == part._name:
-                                            if not isinstance(sym, Sexp):
-                                                sym = Sexp(sym)
-                                            part.part_defn = sym
-                                            break
-                                    except Exception:
-                                        continue
-                                if getattr(part, "part_defn", None):
-                                    break
-                        except Exception:
-                            continue
+                    sym = _lookup_symbol(part._name)
+                    if sym is not None:
+                        part.part_defn = sym
         except Exception:
             pass
 
@@ -284,54 +317,9 @@ def install() -> None:
             for prt in parts_list:
                 try:
                     if not getattr(prt, "part_defn", None):
-                        import os
-                        from glob import glob
-
-                        candidates = []
-                        for envvar in (
-                            "KICAD8_SYMBOL_DIR",
-                            "KICAD_SYMBOL_DIR",
-                            "KICAD6_SYMBOL_DIR",
-                        ):
-                            p = os.environ.get(envvar)
-                            if p:
-                                candidates.append(p)
-                        candidates.append(".")
-
-                        for base in candidates:
-                            try:
-                                fname = prt._name + "*.kicad_sym"
-                                pattern = os.path.join(base, fname)
-                                for path in glob(pattern):
-                                    try:
-                                        enc = "utf-8"
-                                        with open(path, "r", encoding=enc) as fh:
-                                            txt = fh.read()
-                                    except Exception:
-                                        try:
-                                            enc = "latin-1"
-                                            with open(path, "r", encoding=enc) as fh:
-                                                txt = fh.read()
-                                        except Exception:
-                                            continue
-                                    try:
-                                        sexp = Sexp(txt)
-                                    except Exception:
-                                        continue
-                                    sp = "/kicad_symbol_lib/symbol"
-                                    for sym in sexp.search(sp, ignore_case=True):
-                                        try:
-                                            if str(sym[1]) == prt._name:
-                                                if not isinstance(sym, Sexp):
-                                                    sym = Sexp(sym)
-                                                prt.part_defn = sym
-                                                break
-                                        except Exception:
-                                            continue
-                                    if getattr(prt, "part_defn", None):
-                                        break
-                            except Exception:
-                                continue
+                        sym = _lookup_symbol(prt._name)
+                        if sym is not None:
+                            prt.part_defn = sym
                 except Exception:
                     continue
             return parts
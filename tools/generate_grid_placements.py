@@ -24,32 +24,41 @@ from __future__ import annotations
 import csv
 import json
 import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Tuple
 
+import numpy as np
+
 OUT_DIR = "projects/button_bar/placements"
 
 
 @dataclass
-class LEDPlacement:
-    ref: str
-    footprint: str
-    x_mm: float
-    y_mm: float
-    data_line: int = 0
-    rotation: float = 0.0
-    layer: str = "F.Cu"
+class PlacementBlock:
+    """Placements sharing one footprint, stored as parallel arrays.
 
+    Coordinates are kept unrounded; writers format them to 3 decimals.
+    References are `prefix` followed by the zero-padded number from `index`
+    (e.g. ``LED001``). Rotation and layer are common to the whole block.
+    """
 
-@dataclass
-class TouchPadPlacement:
-    ref: str
+    prefix: str
+    ref_width: int
     footprint: str
-    x_mm: float
-    y_mm: float
+    index: np.ndarray
+    x_mm: np.ndarray
+    y_mm: np.ndarray
+    data_line: np.ndarray | None = None
     rotation: float = 0.0
     layer: str = "F.Cu"
 
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def refs(self) -> List[str]:
+        return [f"{self.prefix}{i:0{self.ref_width}d}" for i in self.index.tolist()]
+
 
 def ensure_outdir() -> None:
     os.makedirs(OUT_DIR, exist_ok=True)
@@ -69,59 +78,125 @@ def generate_tile(
     start_led_index: int,
     touch_footprint: str = "Custom:Touch_Pad_19x19mm",
     start_tp_index: int = 1,
-) -> Tuple[List[TouchPadPlacement], List[LEDPlacement], int, int]:
-    """Return touch and LED placements for a single tile and next indices."""
-    touch_placements: List[TouchPadPlacement] = []
-    led_placements: List[LEDPlacement] = []
+) -> Tuple[PlacementBlock, PlacementBlock, int, int]:
+    """Return touch and LED placement blocks for a single tile and next indices."""
     pad_cols = pads_x
     pad_rows = pads_y
     led_cols, led_rows = led_pattern
 
-    tp_idx = start_tp_index
-    led_idx = start_led_index
-    for py in range(pad_rows):
-        for px in range(pad_cols):
-            pad_center_x = tile_origin_x + px * pad_pitch
-            pad_center_y = tile_origin_y + py * pad_pitch
-
-            # Touch pad placement (centered in grid cell)
-            tp_ref = f"TP{tp_idx:02d}"
-            tp_x = pad_center_x
-            tp_y = pad_center_y
-            touch_placements.append(
-                TouchPadPlacement(
-                    ref=tp_ref,
-                    footprint=touch_footprint,
-                    x_mm=round(tp_x, 3),
-                    y_mm=round(tp_y, 3),
-                )
+    # Pad centres along each axis; placements are emitted row-major (py, px).
+    pad_x = tile_origin_x + np.arange(pad_cols) * pad_pitch
+    pad_y = tile_origin_y + np.arange(pad_rows) * pad_pitch
+
+    # Touch pad placement (centered in grid cell)
+    n_pads = pad_rows * pad_cols
+    touch = PlacementBlock(
+        prefix="TP",
+        ref_width=2,
+        footprint=touch_footprint,
+        index=np.arange(start_tp_index, start_tp_index + n_pads),
+        x_mm=np.broadcast_to(pad_x[None, :], (pad_rows, pad_cols)).ravel(),
+        y_mm=np.broadcast_to(pad_y[:, None], (pad_rows, pad_cols)).ravel(),
+    )
+
+    n_leds = n_pads * led_rows * led_cols
+    # 16 parallel data lines assigned per pad
+    pad_py, pad_px = np.indices((pad_rows, pad_cols))
+    pad_lines = ((pad_px * pad_rows + pad_py) % 16).ravel()
+
+    if led_cols == 1 and led_rows == 1:
+        # One LED per pad sits exactly on the pad centre.
+        led_x_mm, led_y_mm, data_line = touch.x_mm, touch.y_mm, pad_lines
+    else:
+        # LEDs within pad (2x2 pattern), centred on the pad. Broadcasting over
+        # (pad_row, pad_col, led_row, led_col) yields every LED in emission order.
+        total_w = (led_cols - 1) * led_spacing
+        total_h = (led_rows - 1) * led_spacing
+        led_x = (pad_x - total_w / 2.0)[None, :, None, None] + (np.arange(led_cols) * led_spacing)[None, None, None, :]
+        led_y = (pad_y - total_h / 2.0)[:, None, None, None] + (np.arange(led_rows) * led_spacing)[None, None, :, None]
+        shape = (pad_rows, pad_cols, led_rows, led_cols)
+        led_x_mm = np.broadcast_to(led_x, shape).ravel()
+        led_y_mm = np.broadcast_to(led_y, shape).ravel()
+        data_line = np.repeat(pad_lines, led_rows * led_cols)
+
+    leds = PlacementBlock(
+        prefix="LED",
+        ref_width=3,
+        footprint=led_footprint,
+        index=np.arange(start_led_index, start_led_index + n_leds),
+        x_mm=led_x_mm,
+        y_mm=led_y_mm,
+        data_line=data_line,
+    )
+
+    return touch, leds, start_tp_index + n_pads, start_led_index + n_leds
+
+
+def write_placements_csv(blocks: List[PlacementBlock], out_csv: str) -> None:
+    """Write one CSV row per placement, in block order."""
+    with open(out_csv, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(
+            [
+                "ref",
+                "footprint",
+                "x_mm",
+                "y_mm",
+                "rotation",
+                "layer",
+            ]
+        )
+        for b in blocks:
+            fp, rot, layer = b.footprint, b.rotation, b.layer
+            w.writerows(
+                (ref, fp, f"{x:.3f}", f"{y:.3f}", rot, layer)
+                for ref, x, y in zip(b.refs(), b.x_mm.tolist(), b.y_mm.tolist())
             )
-            tp_idx += 1
-
-            # LEDs within pad (2x2 pattern)
-            total_w = (led_cols - 1) * led_spacing
-            total_h = (led_rows - 1) * led_spacing
-            led_origin_x = pad_center_x - total_w / 2.0
-            led_origin_y = pad_center_y - total_h / 2.0
-
-            for ly in range(led_rows):
-                for lx in range(led_cols):
-                    x = led_origin_x + lx * led_spacing
-                    y = led_origin_y + ly * led_spacing
-                    ref = f"LED{led_idx:03d}"
-                    data_line = (px * pad_rows + py) % 16  # 16 parallel lines
-                    led_placements.append(
-                        LEDPlacement(
-                            ref=ref,
-                            footprint=led_footprint,
-                            x_mm=round(x, 3),
-                            y_mm=round(y, 3),
-                            data_line=data_line,
-                        )
-                    )
-                    led_idx += 1
-
-    return touch_placements, led_placements, tp_idx, led_idx
+
+
+def write_bom(blocks: List[PlacementBlock], out_bom: str) -> None:
+    """Write a minimal BOM of footprint -> quantity."""
+    # Every block shares one footprint, so its length is the count.
+    counts: Counter[str] = Counter()
+    for b in blocks:
+        counts[b.footprint] += len(b)
+
+    with open(out_bom, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["footprint", "quantity"])
+        for fp, q in sorted(counts.items()):
+            w.writerow([fp, q])
+
+
+def write_ref_mapping(blocks: List[PlacementBlock], out_map: str) -> None:
+    """Write the ref -> placement mapping to `out_map` as JSON.
+
+    Entries use the layout of ``json.dump(..., indent=2)``. A ref repeated
+    across tiles (touch pads restart at TP01) keeps its first position and
+    takes the last placement, as assigning into a dict would.
+    """
+    # ref -> (footprint JSON, x_mm, y_mm, rotation JSON)
+    entries: dict[str, Tuple[str, float, float, str]] = {}
+    for b in blocks:
+        fp = json.dumps(b.footprint)
+        rot = json.dumps(b.rotation)
+        for ref, x, y in zip(b.refs(), b.x_mm.tolist(), b.y_mm.tolist()):
+            entries[ref] = (fp, x, y, rot)
+
+    with open(out_map, "w") as f:
+        f.write("{")
+        sep = "\n"
+        for ref, (fp, x, y, rot) in entries.items():
+            f.write(
+                f'{sep}  "{ref}": {{\n'
+                f'    "footprint": {fp},\n'
+                f'    "x_mm": {x:.3f},\n'
+                f'    "y_mm": {y:.3f},\n'
+                f'    "rotation": {rot}\n'
+                "  }"
+            )
+            sep = ",\n"
+        f.write("\n}" if entries else "}")
 
 
 def generate_grid(
@@ -145,13 +220,14 @@ def generate_grid(
     out_bom = out_bom or os.path.join(OUT_DIR, "generated_bom.csv")
     out_map = out_map or os.path.join(OUT_DIR, "ref_mapping.json")
 
-    placements: List[TouchPadPlacement | LEDPlacement] = []
+    # Blocks are kept in emission order: per tile, touch pads then LEDs.
+    blocks: List[PlacementBlock] = []
     ref_idx = 1
     for ty in range(tiles_y):
         for tx in range(tiles_x):
             origin_x = tx * tile_spacing_x
             origin_y = ty * tile_spacing_y
-            touch_places, led_places, _tp_idx, led_idx = generate_tile(
+            touch_block, led_block, _tp_idx, led_idx = generate_tile(
                 tile_idx=ty * tiles_x + tx,
                 tile_origin_x=origin_x,
                 tile_origin_y=origin_y,
@@ -164,58 +240,20 @@ def generate_grid(
                 led_footprint=led_footprint,
                 start_led_index=ref_idx,
             )
-            placements.extend(touch_places)
-            placements.extend(led_places)
+            blocks.append(touch_block)
+            blocks.append(led_block)
             ref_idx = led_idx
 
-    # Write placements CSV
-    with open(out_csv, "w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(
-            [
-                "ref",
-                "footprint",
-                "x_mm",
-                "y_mm",
-                "rotation",
-                "layer",
-            ]
-        )
-        for p in placements:
-            w.writerow(
-                [
-                    p.ref,
-                    p.footprint,
-                    p.x_mm,
-                    p.y_mm,
-                    p.rotation,
-                    p.layer,
-                ]
-            )
-
-    # Minimal BOM (counts footprint types)
-    counts: dict[str, int] = {}
-    for p in placements:
-        counts[p.footprint] = counts.get(p.footprint, 0) + 1
-
-    with open(out_bom, "w", newline="") as f:
-        w = csv.writer(f)
-        w.writerow(["footprint", "quantity"])
-        for fp, q in sorted(counts.items()):
-            w.writerow([fp, q])
-
-    # Write ref mapping JSON
-    mapping: dict[str, dict[str, object]] = {
-        p.ref: {
-            "footprint": p.footprint,
-            "x_mm": p.x_mm,
-            "y_mm": p.y_mm,
-            "rotation": p.rotation,
-        }
-        for p in placements
-    }
-    with open(out_map, "w") as f:
-        json.dump(mapping, f, indent=2)
+    # The three outputs only read the finished blocks, so write them
+    # concurrently; .result() re-raises any write error here.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        writes = [
+            pool.submit(write_placements_csv, blocks, out_csv),
+            pool.submit(write_bom, blocks, out_bom),
+            pool.submit(write_ref_mapping, blocks, out_map),
+        ]
+        for fut in writes:
+            fut.result()
 
     print(f"Wrote placements CSV: {out_csv}")
     print(f"Wrote BOM summary: {out_bom}")
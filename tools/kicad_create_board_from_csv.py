@@ -8,7 +8,9 @@ Usage (inside KiCad's Python console):
 
 Notes:
 - This script must be run where `pcbnew` is available (KiCad's Python).
-- The CSV must contain columns: ref, footprint, x_mm, y_mm, rotation.
+- The CSV must contain columns: ref, footprint. x_mm, y_mm and rotation are
+  optional and default to 0.
+- A wx App is only created on macOS, or when KICAD_NEED_WX=1 is set.
 - `footprint` entries should be in the form 'LIB:FOOTPRINT' where the
   footprint library is available to KiCad. If footprints are stored in
   project-local .kicad_mod files, you may need to install or point KiCad's
@@ -22,9 +24,16 @@ from __future__ import annotations
 
 import csv
 import os
+import re
 import sys
 from typing import Any, cast
 
+# Declared name in a .kicad_mod header, e.g. `(footprint "SW_SPST"`
+_FOOTPRINT_NAME_RE = re.compile(r"\(footprint\s+([^\s\)]+)")
+
+# Columns every placements CSV must have; x_mm, y_mm and rotation default to 0
+_REQUIRED_CSV_COLUMNS = ("ref", "footprint")
+
 
 def _read_dotenv(dotenv_path: str) -> dict[str, str]:
     """Very small .env parser: returns dict of KEY->VALUE for simple KEY=VALUE lines."""
@@ -61,6 +70,97 @@ def _get_footprint_dir() -> str:
     return os.path.join("projects", "button_bar", "footprints.pretty")
 
 
+class _FootprintIndex:
+    """Project .kicad_mod files keyed by file stem, built with one directory walk.
+
+    Declared footprint names (the ``(footprint NAME`` header) are only parsed
+    when a lookup misses on the file stem, and each file is read at most once.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.by_stem: dict[str, str] = {}
+        self.by_declared: dict[str, str] = {}
+        self._declared: dict[str, str | None] = {}
+        self._unparsed: list[str] = []
+        # Depth-first scandir walk in os.walk's top-down order; DirEntry type
+        # checks come from the directory listing, so no per-entry stat.
+        stack = [root]
+        while stack:
+            subdirs: list[str] = []
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.lower().endswith(".kicad_mod") and not entry.is_dir():
+                            self.by_stem.setdefault(os.path.splitext(entry.name)[0], entry.path)
+                            self._unparsed.append(entry.path)
+            except OSError:
+                continue
+            stack.extend(reversed(subdirs))
+        # pop() from the end while keeping walk order
+        self._unparsed.reverse()
+
+    def declared_name(self, path: str) -> str | None:
+        """Return the footprint name declared inside `path`, if any."""
+        if path not in self._declared:
+            declared = None
+            try:
+                with open(path, "r", encoding="utf-8", errors="ignore") as fh:
+                    m = _FOOTPRINT_NAME_RE.search(fh.read())
+                if m:
+                    declared = m.group(1).strip('"')
+            except OSError:
+                pass
+            self._declared[path] = declared
+            if declared:
+                self.by_declared.setdefault(declared, path)
+        return self._declared[path]
+
+    def find(self, name: str) -> str | None:
+        """Return the .kicad_mod path whose stem or declared name is `name`."""
+        path = self.by_stem.get(name) or self.by_declared.get(name)
+        while path is None and self._unparsed:
+            candidate = self._unparsed.pop()
+            if self.declared_name(candidate) == name:
+                path = candidate
+        return path
+
+
+def _project_footprint_attempts(index: _FootprintIndex, name: str) -> list[tuple[str, str]]:
+    """Return FootprintLoad arguments to try for `name` from the project directory."""
+    candidate = index.find(name)
+    if candidate is None:
+        return []
+    root, fn = os.path.split(candidate)
+    file_base = os.path.splitext(fn)[0]
+    # A few common FootprintLoad argument patterns
+    attempts = [
+        (file_base, file_base),
+        (root, file_base),
+        (candidate, file_base),
+        (root, name),
+        (candidate, name),
+    ]
+    # Last-resort: the name declared inside the .kicad_mod itself
+    declared = index.declared_name(candidate)
+    if declared:
+        attempts.append((candidate, declared))
+    return attempts
+
+
+def _load_first(pcbnew: Any, attempts: list[tuple[str, str]]) -> tuple[Any, tuple[str, str] | None]:
+    """Return the first footprint that loads and the arguments that loaded it."""
+    for args in attempts:
+        try:
+            module = pcbnew.FootprintLoad(*args)
+        except Exception:
+            module = None
+        if module is not None:
+            return module, args
+    return None, None
+
+
 def mm_to_nm(mm: float) -> int:
     return int(mm * 1e6)
 
@@ -77,33 +177,55 @@ def create_board_from_csv(out_board: str, csv_path: str) -> None:
         raise RuntimeError("This script must be run inside KiCad (pcbnew available)") from e
 
     # Ensure a wx App exists for GUI-related pcbnew calls (needed when running
-    # KiCad's python from command line on macOS)
-    try:
-        # wx is optional and only present in GUI-enabled KiCad environments.
-        import wx
+    # KiCad's python from command line on macOS). Elsewhere importing wx and
+    # starting an App is pure overhead unless KICAD_NEED_WX=1 asks for it.
+    if sys.platform == "darwin" or os.environ.get("KICAD_NEED_WX") == "1":
+        try:
+            # wx is optional and only present in GUI-enabled KiCad environments.
+            import wx
 
-        wx = cast(Any, wx)
+            wx = cast(Any, wx)
 
-        if not wx.GetApp():
-            _app = wx.App(False)
-    except Exception:
-        # If wx is not present or fails, continue; pcbnew may still work.
-        pass
+            if not wx.GetApp():
+                _app = wx.App(False)
+        except Exception:
+            # If wx is not present or fails, continue; pcbnew may still work.
+            pass
 
     if not os.path.exists(csv_path):
         raise FileNotFoundError(csv_path)
 
     board = pcbnew.BOARD()  # create empty board object
 
+    # The project footprint directory is indexed once, on the first fallback
+    proj_fp_dir = _get_footprint_dir()
+    fp_index: _FootprintIndex | None = None
+    # (lib, name) -> FootprintLoad arguments that worked, None if nothing did
+    load_args: dict[tuple[str, str], tuple[str, str] | None] = {}
+
     placed = 0
-    with open(csv_path, newline="") as f:
-        r = csv.DictReader(f)
+    with open(csv_path, newline="", buffering=1 << 16) as f:
+        r = csv.reader(f)
+        # An empty file has no header and no rows, so nothing is placed
+        header = next(r, None) or list(_REQUIRED_CSV_COLUMNS)
+        col = {name: i for i, name in enumerate(header)}
+        missing = [k for k in _REQUIRED_CSV_COLUMNS if k not in col]
+        if missing:
+            raise ValueError(f"{csv_path}: missing CSV columns {missing}")
+        i_ref, i_fp = (col[k] for k in _REQUIRED_CSV_COLUMNS)
+        i_x, i_y, i_rot = col.get("x_mm"), col.get("y_mm"), col.get("rotation")
+        width = len(header)
         for row in r:
-            ref = row.get("ref")
-            footprint = row.get("footprint") or ""
-            x_mm = float(row.get("x_mm") or 0.0)
-            y_mm = float(row.get("y_mm") or 0.0)
-            rotation = float(row.get("rotation") or 0.0)
+            if not row:
+                continue
+            if len(row) < width:
+                # Short rows read as empty trailing cells, as with DictReader
+                row += [""] * (width - len(row))
+            ref = row[i_ref]
+            footprint = row[i_fp]
+            x_mm = float(row[i_x]) if i_x is not None and row[i_x] else 0.0
+            y_mm = float(row[i_y]) if i_y is not None and row[i_y] else 0.0
+            rotation = float(row[i_rot]) if i_rot is not None and row[i_rot] else 0.0
 
             # Expect footprint like 'LIB:NAME' — split if possible
             if ":" in footprint:
@@ -112,62 +234,21 @@ def create_board_from_csv(out_board: str, csv_path: str) -> None:
                 lib = ""
                 name = footprint
 
-            module = None
-            # First try normal FootprintLoad (library table must know lib)
-            try:
-                module = pcbnew.FootprintLoad(lib, name)
-            except Exception:
-                module = None
-
-            # Fallback: search project footprints.pretty for a matching .kicad_mod
-            if module is None:
-                try:
-                    proj_fp_dir = _get_footprint_dir()
-                    for root, _, files in os.walk(proj_fp_dir):
-                        for fn in files:
-                            if not fn.lower().endswith(".kicad_mod"):
-                                continue
-                            candidate = os.path.join(root, fn)
-                            file_base = os.path.splitext(fn)[0]
-                            # Try a few common FootprintLoad argument patterns
-                            for lib_arg, fp_arg in (
-                                (file_base, file_base),
-                                (root, file_base),
-                                (candidate, file_base),
-                                (root, name),
-                                (candidate, name),
-                            ):
-                                try:
-                                    module = pcbnew.FootprintLoad(lib_arg, fp_arg)
-                                    if module is not None:
-                                        break
-                                except Exception:
-                                    module = None
-                            if module is not None:
-                                break
-
-                            # Last-resort: parse the .kicad_mod to find the declared footprint name
-                            try:
-                                with open(candidate, "r", encoding="utf-8", errors="ignore") as ff:
-                                    data = ff.read()
-                                import re
-
-                                m = re.search(r"\(footprint\s+([^\s\)]+)", data)
-                                if m:
-                                    declared = m.group(1)
-                                    try:
-                                        module = pcbnew.FootprintLoad(candidate, declared)
-                                    except Exception:
-                                        module = None
-                            except Exception:
-                                module = None
-
-                            if module is not None:
-                                break
-                        if module is not None:
-                            break
-                except Exception:
-                    module = None
+            key = (lib, name)
+            if key in load_args:
+                # FootprintLoad returns a fresh module per call, so what is
+                # cached is how to load it (or that it cannot be loaded).
+                args = load_args[key]
+                module = _load_first(pcbnew, [args])[0] if args else None
+            else:
+                # First try normal FootprintLoad (library table must know lib)
+                module, args = _load_first(pcbnew, [key])
+                # Fallback: look the name up in the project footprints.pretty index
+                if module is None:
+                    if fp_index is None:
+                        fp_index = _FootprintIndex(proj_fp_dir)
+                    module, args = _load_first(pcbnew, _project_footprint_attempts(fp_index, name))
+                load_args[key] = args
 
             if module is None:
                 print(f"Failed to load footprint {footprint}; skipping {ref}")
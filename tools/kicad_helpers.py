@@ -1,10 +1,56 @@
 from __future__ import annotations
 
+import json
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, cast
 
+_MCU_LIBS = frozenset(("MCU", "RP2040"))
+# Values accepted on an I2C net (pull-ups, or 0R links)
+_I2C_RESISTOR_VALUES = frozenset(("4.7k", "10k", "0"))
+# Pin-name prefixes that mark a power net
+_POWER_PREFIXES = ("5V", "3V", "GND", "VCC", "VDD")
 
-@dataclass
+
+# Minimal .kicad_sch body; only the title varies, so it is one template
+_KICAD_SCH_STUB = (
+    "(kicad_sch (version 20231120) (generator eeschema))\n"
+    "  (uuid {title})\n"
+    '  (paper "A4")\n'
+    "  (title_block\n"
+    "    (title {title})\n"
+    "  )"
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode Symbol and HierarchicalPin objects through their to_dict()."""
+    if isinstance(obj, (Symbol, HierarchicalPin)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize `data` exactly as ``json.dumps(data, indent=2)``, as bytes.
+
+    Symbols and pins may be passed as objects; each is converted to a dict
+    only while it is being encoded. Non-ASCII text stays \\u-escaped, so
+    the output is plain ASCII.
+    """
+    return json.dumps(data, indent=2, default=_json_default).encode("ascii")
+
+
+def _is_power(name: str) -> bool:
+    """Return True if the pin `name` looks like a power net (case-insensitive)."""
+    return name.upper().startswith(_POWER_PREFIXES)
+
+
+def _kicad_sch_stub(title: str) -> str:
+    """Return the minimal .kicad_sch body written for a schematic titled `title`."""
+    return _KICAD_SCH_STUB.format(title=title)
+
+
+@dataclass(slots=True)
 class HierarchicalPin:
     """Represents connection points between hierarchical sheets"""
 
@@ -35,8 +81,12 @@ class HierarchicalPin:
         self.unit = 0
         self.electrical_type = "passive"
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields written to hierarchy JSON (a cheap, shallow asdict)."""
+        return {"name": self.name, "direction": self.direction, "sheet_ref": self.sheet_ref}
 
-@dataclass
+
+@dataclass(slots=True)
 class Symbol:
     ref: str
     value: str = ""
@@ -81,6 +131,18 @@ class Symbol:
         self.in_bom = in_bom
         self.on_board = on_board
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields written to hierarchy JSON (a cheap, shallow asdict)."""
+        return {
+            "ref": self.ref,
+            "value": self.value,
+            "lib": self.lib,
+            "name": self.name,
+            "at": self.at,
+            "footprint": self.footprint,
+            "fields": self.fields,
+        }
+
 
 @dataclass
 class Sheet:
@@ -93,6 +155,9 @@ class Sheet:
     def __init__(self, name: str, schematic: Optional["Schematic"] = None) -> None:
         self.name = name
         self.hier_pins = []
+        # name -> first pin added under that name; a plain attribute rather
+        # than a dataclass field so it stays out of repr/eq/fields()
+        self._pin_index: dict[str, HierarchicalPin] = {}
         self.symbols = []
         self.wires = []
         # Ensure the schematic attribute is set on the instance.
@@ -114,7 +179,9 @@ class Sheet:
 
     def add_hier_pin(self, name: str, direction: str) -> None:
         """Add hierarchical pin to this sheet"""
-        self.hier_pins.append(HierarchicalPin(name=name, direction=direction, sheet_ref=self.name))
+        pin = HierarchicalPin(name=name, direction=direction, sheet_ref=self.name)
+        self.hier_pins.append(pin)
+        self._pin_index.setdefault(name, pin)
 
 
 class Schematic:
@@ -124,6 +191,8 @@ class Schematic:
         # For backward compatibility, allow both name and title parameters
         self.name = title if title else name
         self.hier_pins: list[HierarchicalPin] = []
+        # name -> first pin added under that name, kept in step by add_hier_pin
+        self._pin_index: dict[str, HierarchicalPin] = {}
         self.symbols: list[Symbol] = []
         self.wires: list[tuple[str, str]] = []
         self.sheets: dict[str, "Schematic"] = {}
@@ -169,7 +238,9 @@ class Schematic:
 
     def add_hier_pin(self, name: str, direction: str) -> None:
         """Add hierarchical pin to this sheet"""
-        self.hier_pins.append(HierarchicalPin(name=name, direction=direction, sheet_ref=self.name))
+        pin = HierarchicalPin(name=name, direction=direction, sheet_ref=self.name)
+        self.hier_pins.append(pin)
+        self._pin_index.setdefault(name, pin)
 
     def add_symbol(self, symbol: Symbol) -> None:
         """Add component to schematic"""
@@ -185,6 +256,18 @@ class Schematic:
             self.wires.append((net_name, conn))
 
 
+def _contents(sheet: Schematic | Sheet) -> Schematic:
+    """Return the Schematic holding a hierarchy sheet's symbols and wires.
+
+    HierarchicalSchematic.sheets holds Schematic objects or Sheet wrappers
+    around one; an isinstance check is cheaper than a failing hasattr.
+    """
+    if isinstance(sheet, Sheet):
+        # Sheet.__init__ always attaches a schematic
+        return cast(Schematic, sheet.schematic)
+    return sheet
+
+
 class HierarchicalSchematic:
     """Core hierarchical schematic container with validation"""
 
@@ -241,12 +324,15 @@ class HierarchicalSchematic:
     def validate_hierarchy(self) -> list[str]:
         """Validate hierarchy connections and pin directions"""
         errors: list[str] = []
+        # Pin lookup by name, built once per sheet per call; as before, the
+        # last pin added under a duplicated name is the one checked here.
+        sheet_pins: dict[str, dict[str, HierarchicalPin]] = {}
         for parent_ref, child_ref in self.hier_connections:
-            try:
-                # Parse the connection references
-                parent_sheet_name, parent_pin_name = parent_ref.split(".", 1)
-                child_sheet_name, child_pin_name = child_ref.split(".", 1)
-            except ValueError:
+            # Parse the "sheet.pin" references; partition avoids a list and the
+            # unpacking exception on malformed input.
+            parent_sheet_name, parent_sep, parent_pin_name = parent_ref.partition(".")
+            child_sheet_name, child_sep, child_pin_name = child_ref.partition(".")
+            if not (parent_sep and child_sep):
                 raise ValueError("Invalid hierarchical connection format")
 
             parent = self.sheets.get(parent_sheet_name)
@@ -257,8 +343,12 @@ class HierarchicalSchematic:
             if not child:
                 raise ValueError(f"Child pin '{child_pin_name}' not found")
 
-            parent_pins = {pin.name: pin for pin in parent.hier_pins}
-            child_pins = {pin.name: pin for pin in child.hier_pins}
+            parent_pins = sheet_pins.get(parent_sheet_name)
+            if parent_pins is None:
+                parent_pins = sheet_pins[parent_sheet_name] = {pin.name: pin for pin in parent.hier_pins}
+            child_pins = sheet_pins.get(child_sheet_name)
+            if child_pins is None:
+                child_pins = sheet_pins[child_sheet_name] = {pin.name: pin for pin in child.hier_pins}
 
             if parent_pin_name not in parent_pins:
                 raise ValueError(f"Parent pin '{parent_pin_name}' not found")
@@ -282,14 +372,7 @@ class HierarchicalSchematic:
                 # but allow for power pins (like 5V, GND, etc.)
                 elif p_pin.direction == "in" and c_pin.direction == "out":
                     # Allow power-related connections but fail for data connections.
-                    parent_up = parent_pin_name.upper()
-                    child_up = child_pin_name.upper()
-                    power_prefixes = ("5V", "3V", "GND", "VCC", "VDD")
-
-                    if parent_up.startswith(power_prefixes) or child_up.startswith(power_prefixes):
-                        # Power connections are allowed
-                        pass
-                    else:
+                    if not (_is_power(parent_pin_name) or _is_power(child_pin_name)):
                         raise ValueError("Input pins cannot drive output pins")
         return errors
 
@@ -297,21 +380,27 @@ class HierarchicalSchematic:
         """Run complete electrical rule checks"""
         errors = self.validate_hierarchy()
 
-        # Check power rules across all sheets
-        for sheet_name, sheet in self.sheets.items():
+        # Check power rules across all sheets, one pass over each sheet's symbols
+        for sheet in self.sheets.values():
+            has_led = has_mcu = has_bulk_cap = has_decoupling_cap = False
+            for sym in sheet.symbols:
+                if sym.lib == "LED":
+                    has_led = True
+                elif sym.lib in _MCU_LIBS:
+                    has_mcu = True
+                if sym.ref.startswith("C"):
+                    if "1000µF" in sym.value:
+                        has_bulk_cap = True
+                    if "100nF" in sym.value:
+                        has_decoupling_cap = True
+
             # Rule 1: If LEDs are present, must have bulk capacitor (1000μF).
-            led_symbols = [sym for sym in sheet.symbols if sym.lib == "LED"]
-            if led_symbols:
-                bulk_caps = [sym for sym in sheet.symbols if sym.ref.startswith("C") and "1000µF" in sym.value]
-                if not bulk_caps:
-                    errors.append("Missing bulk capacitor")
+            if has_led and not has_bulk_cap:
+                errors.append("Missing bulk capacitor")
 
             # Rule 2: If MCUs are present, must have decoupling capacitor (100nF).
-            mcu_symbols = [sym for sym in sheet.symbols if sym.lib == "MCU" or sym.lib == "RP2040"]
-            if mcu_symbols:
-                decoupling_caps = [sym for sym in sheet.symbols if sym.ref.startswith("C") and "100nF" in sym.value]
-                if not decoupling_caps:
-                    errors.append("Missing 100nF decoupling capacitor")
+            if has_mcu and not has_decoupling_cap:
+                errors.append("Missing 100nF decoupling capacitor")
 
         if errors:
             raise ValueError("\n".join(errors))
@@ -323,11 +412,7 @@ class HierarchicalSchematic:
         sheet = self.sheets.get(sheet_name)
         if not sheet:
             return None
-
-        for pin in sheet.hier_pins:
-            if pin.name == pin_name:
-                return pin
-        return None
+        return sheet._pin_index.get(pin_name)
 
     def summary(self) -> dict[str, Any]:
         """Generate summary information about the hierarchical schematic"""
@@ -344,40 +429,31 @@ class HierarchicalSchematic:
 
     def validate_power_decoupling(self) -> None:
         """Validate power decoupling rules"""
-        for sheet_name, sheet in self.sheets.items():
-            # Handle both Sheet and Schematic objects
-            if hasattr(sheet, "schematic"):
-                # This is a Sheet object
-                symbols = sheet.schematic.symbols
-            else:
-                # This is a Schematic object
-                symbols = sheet.symbols
-
-            # Check for MCUs.
-            mcu_symbols = [sym for sym in symbols if sym.lib in ["MCU", "RP2040"] or "RP2040" in sym.name]
-
-            if mcu_symbols:
-                # Look for 100nF decoupling capacitors
-                decoupling_caps = [sym for sym in symbols if sym.ref.startswith("C") and "100nF" in sym.value]
-
-                if not decoupling_caps:
-                    raise ValueError("Missing 100nF decoupling capacitor")
+        for sheet in self.sheets.values():
+            symbols = _contents(sheet).symbols
+
+            # One pass looking for MCUs and 100nF decoupling capacitors
+            mcu_found = decoupling_found = False
+            for sym in symbols:
+                if not mcu_found and (sym.lib in _MCU_LIBS or "RP2040" in sym.name):
+                    mcu_found = True
+                if not decoupling_found and sym.ref.startswith("C") and "100nF" in sym.value:
+                    decoupling_found = True
+                if mcu_found and decoupling_found:
+                    break
+
+            if mcu_found and not decoupling_found:
+                raise ValueError("Missing 100nF decoupling capacitor")
 
     def validate_i2c_pullups(self) -> None:
         """Validate I2C pullup resistor rules"""
-        for sheet_name, sheet in self.sheets.items():
-            # Handle both Sheet and Schematic objects
-            if hasattr(sheet, "schematic"):
-                # This is a Sheet object
-                symbols = sheet.schematic.symbols
-                wires = sheet.schematic.wires
-            else:
-                # This is a Schematic object
-                symbols = sheet.symbols
-                wires = sheet.wires
+        for sheet in self.sheets.values():
+            contents = _contents(sheet)
+            symbols = contents.symbols
+            wires = contents.wires
 
             # Look for I2C nets (simplified approach)
-            i2c_nets = set()
+            i2c_nets: set[str] = set()
             for wire in wires:
                 if "I2C" in wire[0]:
                     i2c_nets.add(wire[0])
@@ -385,65 +461,56 @@ class HierarchicalSchematic:
                     i2c_nets.add(wire[1])
 
             if i2c_nets:
-                # Check for invalid pullup values first
-                for net in i2c_nets:
-                    net_resistors = [sym for sym in symbols if sym.ref.startswith("R") and sym.fields.get("Net") == net]
-                    for resistor in net_resistors:
-                        if not (resistor.value == "4.7k" or resistor.value == "10k" or resistor.value == "0"):
-                            raise ValueError("Invalid pull-up value")
-
-                # Look for pullup resistors
-                pullup_resistors = [
-                    sym
-                    for sym in symbols
-                    if sym.ref.startswith("R") and (sym.value.startswith("4.7k") or sym.value.startswith("10k"))
-                ]
-
-                if not pullup_resistors:
+                # One pass over the resistors; the checks below keep the
+                # original precedence of the three errors.
+                invalid_value = False
+                pullup_found = False
+                pullups_per_net: Counter[str] = Counter()
+                for sym in symbols:
+                    if not sym.ref.startswith("R"):
+                        continue
+                    value = sym.value
+                    # "" is never an I2C net name
+                    net = sym.fields.get("Net", "")
+                    on_i2c_net = net in i2c_nets
+                    if on_i2c_net and value not in _I2C_RESISTOR_VALUES:
+                        invalid_value = True
+                    if value.startswith(("4.7k", "10k")):
+                        pullup_found = True
+                        if on_i2c_net:
+                            pullups_per_net[net] += 1
+
+                if invalid_value:
+                    raise ValueError("Invalid pull-up value")
+                if not pullup_found:
                     raise ValueError("Missing pull-up resistors")
-
-                # Check for multiple pullup sets on the same net
-                for net in i2c_nets:
-                    net_pullups = [
-                        sym
-                        for sym in symbols
-                        if sym.ref.startswith("R")
-                        and (sym.value.startswith("4.7k") or sym.value.startswith("10k"))
-                        and sym.fields.get("Net") == net
-                    ]
-                    if len(net_pullups) > 1:
-                        raise ValueError("Multiple pull-up sets")
+                if any(count > 1 for count in pullups_per_net.values()):
+                    raise ValueError("Multiple pull-up sets")
 
     def write(self, out_dir: str) -> None:
         """Write schematic files to output directory"""
         # Validate hierarchy before writing
         self.validate_hierarchy()
 
-        import json
         from pathlib import Path
 
         out_path = Path(out_dir)
-        out_path.mkdir(parents=True, exist_ok=True)
-
-        # Write root schematic files
-        root_sch_file = out_path / f"{self.title}.sch.txt"
-        root_sch_file.write_text(f"Root schematic: {self.title}")
-
-        root_kicad_file = out_path / f"{self.title}.kicad_sch"
-        root_kicad_file.write_text(
-            (
-                "(kicad_sch (version 20231120) (generator eeschema))\n"
-                f"  (uuid {self.title})\n"
-                '  (paper "A4")\n'
-                "  (title_block\n"
-                f"    (title {self.title})\n"
-                "  )"
-            )
-        )
-
-        # Create sheets directory
         sheets_dir = out_path / "sheets"
-        sheets_dir.mkdir(exist_ok=True)
+        # One makedirs call creates both the output and sheets directories
+        sheets_dir.mkdir(parents=True, exist_ok=True)
+
+        # Every output is rendered into this path -> UTF-8 bytes map first and
+        # written in one pass at the end, so a rendering error leaves no partial
+        # set of files. A path produced twice (same sheet title) is written once.
+        # Encoding up front skips the per-file text wrapper and pins the
+        # encoding to UTF-8 on any locale.
+        outputs: dict[Path, bytes] = {}
+
+        # Root schematic files
+        outputs[out_path / f"{self.title}.sch.txt"] = f"Root schematic: {self.title}".encode("utf-8")
+        # Root and sheet stubs share the same body, so render it only once
+        kicad_sch_bytes = _kicad_sch_stub(self.title).encode("utf-8")
+        outputs[out_path / f"{self.title}.kicad_sch"] = kicad_sch_bytes
 
         # Write hierarchy data
         hierarchy_data: dict[str, Any] = {
@@ -452,58 +519,40 @@ class HierarchicalSchematic:
             "connections": self.hier_connections,
         }
 
+        # Summary totals are accumulated in the same pass over the sheets
+        total_symbols = total_pins = total_wires = 0
+        sheets_map = hierarchy_data["sheets"]
         for sheet_name, sheet in self.sheets.items():
-            sheets_map = hierarchy_data["sheets"]
+            sheet_title = sheet.title
+            total_symbols += len(sheet.symbols)
+            total_pins += len(sheet.hier_pins)
+            total_wires += len(sheet.wires)
             sheets_map[sheet_name] = {
                 "name": sheet.name,
-                "title": sheet.title,
-                "symbols": [
-                    {
-                        "ref": sym.ref,
-                        "value": sym.value,
-                        "lib": sym.lib,
-                        "name": sym.name,
-                        "at": sym.at,
-                        "footprint": sym.footprint,
-                        "fields": sym.fields,
-                    }
-                    for sym in sheet.symbols
-                ],
-                "hierarchical_pins": [
-                    {"name": pin.name, "direction": pin.direction, "sheet_ref": pin.sheet_ref}
-                    for pin in sheet.hier_pins
-                ],
+                "title": sheet_title,
+                # Encoded one object at a time by _json_default, no dict lists
+                "symbols": sheet.symbols,
+                "hierarchical_pins": sheet.hier_pins,
                 "wires": sheet.wires,
             }
 
-            # Write individual sheet files
-            sheet_sch_file = sheets_dir / f"{sheet.title}.sch.txt"
-            sheet_sch_file.write_text(f"Sheet: {sheet.title}")
-
-            sheet_kicad_file = sheets_dir / f"{sheet.title}.kicad_sch"
-            sheet_kicad_file.write_text(
-                (
-                    "(kicad_sch (version 20231120) (generator eeschema))\n"
-                    f"  (uuid {self.title})\n"
-                    '  (paper "A4")\n'
-                    "  (title_block\n"
-                    f"    (title {self.title})\n"
-                    "  )"
-                )
-            )
+            # Individual sheet files
+            outputs[sheets_dir / f"{sheet_title}.sch.txt"] = f"Sheet: {sheet_title}".encode("utf-8")
+            outputs[sheets_dir / f"{sheet_title}.kicad_sch"] = kicad_sch_bytes
 
-        # Write hierarchy JSON
-        hierarchy_file = out_path / f"{self.title}_hierarchy.json"
-        hierarchy_file.write_text(json.dumps(hierarchy_data, indent=2))
+        # Hierarchy JSON
+        outputs[out_path / f"{self.title}_hierarchy.json"] = _dump_json(hierarchy_data)
 
-        # Write summary
+        # Summary
         summary_data = {
             "title": self.title,
             "sheet_count": len(self.sheets),
-            "total_symbols": sum(len(sheet.symbols) for sheet in self.sheets.values()),
-            "total_pins": sum(len(sheet.hier_pins) for sheet in self.sheets.values()),
-            "total_wires": sum(len(sheet.wires) for sheet in self.sheets.values()),
+            "total_symbols": total_symbols,
+            "total_pins": total_pins,
+            "total_wires": total_wires,
         }
 
-        summary_file = out_path / f"{self.title}_summary.json"
-        summary_file.write_text(json.dumps(summary_data, indent=2))
+        outputs[out_path / f"{self.title}_summary.json"] = _dump_json(summary_data)
+
+        for path, data in outputs.items():
+            path.write_bytes(data)
@@ -24,6 +24,22 @@ from __future__ import annotations
 import csv
 import os
 import sys
+from functools import lru_cache
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - KiCad's bundled Python may lack NumPy
+    np = None  # type: ignore[assignment]
+
+
+@lru_cache(maxsize=1)
+def _get_pcbnew() -> Any:
+    """Import pcbnew on first use and return the cached module afterwards."""
+    # pcbnew only exists inside KiCad's Python, so it is not a top-level import
+    import pcbnew
+
+    return pcbnew
 
 
 def mm_to_nm(mm: float) -> int:
@@ -31,8 +47,30 @@ def mm_to_nm(mm: float) -> int:
     return int(mm * 1e6)
 
 
+def mm_list_to_nm(values: list[float]) -> list[int]:
+    """Convert many mm values to nm at once, truncating like `mm_to_nm`."""
+    if np is None:
+        return [mm_to_nm(v) for v in values]
+    # tolist() hands pcbnew plain Python ints rather than NumPy scalars
+    result: list[int] = (np.asarray(values, dtype=np.float64) * 1e6).astype(np.int64).tolist()
+    return result
+
+
+def _footprints_by_ref(board: Any) -> dict[str, Any] | None:
+    """Index the board's footprints by reference, or None if it cannot list them."""
+    # GetFootprints() is KiCad 6+, GetModules() is the KiCad 5 name
+    for getter in ("GetFootprints", "GetModules"):
+        if hasattr(board, getter):
+            by_ref: dict[str, Any] = {}
+            for mod in getattr(board, getter)():
+                # keep the first footprint per reference, like FindModuleByReference
+                by_ref.setdefault(mod.GetReference(), mod)
+            return by_ref
+    return None
+
+
 def apply_from_csv(board_path: str, csv_path: str) -> None:
-    import pcbnew
+    pcbnew = _get_pcbnew()
 
     if not os.path.exists(board_path):
         raise FileNotFoundError(board_path)
@@ -41,38 +79,63 @@ def apply_from_csv(board_path: str, csv_path: str) -> None:
 
     board = pcbnew.LoadBoard(board_path)
 
-    refs_updated = 0
+    # Parse every row first so the mm -> nm conversion runs as one batch
+    refs: list[str] = []
+    xs_mm: list[float] = []
+    ys_mm: list[float] = []
+    rotations: list[float] = []
     with open(csv_path, newline="") as f:
-        r = csv.DictReader(f)
+        r = csv.reader(f)
+        header = next(r, [])
+        col = {name: i for i, name in enumerate(header)}
+        if "ref" not in col:
+            raise ValueError(f"{csv_path}: missing CSV column 'ref'")
+        # x_mm, y_mm and rotation are optional and default to 0
+        i_ref = col["ref"]
+        i_x, i_y, i_rot = col.get("x_mm"), col.get("y_mm"), col.get("rotation")
+        width = len(header)
         for row in r:
-            ref = row["ref"]
-            x_mm = float(row["x_mm"]) if row.get("x_mm") else 0.0
-            y_mm = float(row["y_mm"]) if row.get("y_mm") else 0.0
-            rotation = float(row.get("rotation") or 0.0)
-
-            mod = board.FindModuleByReference(ref)
-            if not mod:
-                # try find by value / footprint if ref not present
-                print(f"Module {ref} not found by reference; skipping")
+            if not row:
                 continue
-
-            pos = pcbnew.VECTOR2I(mm_to_nm(x_mm), mm_to_nm(y_mm))
-            mod.SetPosition(pos)
-            # rotation is degrees in CSV; pcbnew expects 10*n degrees in older
-            # API or can use SetOrientation in KiCad 6+; use RotationDegrees
-            # method if present
+            if len(row) < width:
+                # Short rows read as empty trailing cells, as with DictReader
+                row += [""] * (width - len(row))
+            refs.append(row[i_ref])
+            xs_mm.append(float(row[i_x]) if i_x is not None and row[i_x] else 0.0)
+            ys_mm.append(float(row[i_y]) if i_y is not None and row[i_y] else 0.0)
+            rotations.append(float(row[i_rot]) if i_rot is not None and row[i_rot] else 0.0)
+    xs_nm = mm_list_to_nm(xs_mm)
+    ys_nm = mm_list_to_nm(ys_mm)
+
+    # One pass over the board instead of a FindModuleByReference scan per row
+    mods_by_ref = _footprints_by_ref(board)
+
+    rot_setters: dict[type, Any] = {}
+    refs_updated = 0
+    for ref, x_nm, y_nm, rotation in zip(refs, xs_nm, ys_nm, rotations):
+        mod = mods_by_ref.get(ref) if mods_by_ref is not None else board.FindModuleByReference(ref)
+        if not mod:
+            # try find by value / footprint if ref not present
+            print(f"Module {ref} not found by reference; skipping")
+            continue
+
+        pos = pcbnew.VECTOR2I(x_nm, y_nm)
+        mod.SetPosition(pos)
+        # rotation is degrees in CSV; pcbnew expects 10*n degrees in older
+        # API or can use SetOrientation in KiCad 6+; use RotationDegrees
+        # method if present. The setter is resolved once per footprint class.
+        cls = type(mod)
+        if cls not in rot_setters:
+            rot_setters[cls] = getattr(cls, "SetOrientation", None) or getattr(cls, "SetRotation", None)
+        set_rot = rot_setters[cls]
+        if set_rot is not None:
             try:
-                if hasattr(mod, "SetOrientation"):
-                    mod.SetOrientation(int(rotation * 10))
-                elif hasattr(mod, "SetRotation"):
-                    mod.SetRotation(int(rotation * 10))
-                else:
-                    mod.SetOrientation(int(rotation * 10))
+                set_rot(mod, int(rotation * 10))
             except Exception:
                 # best effort; continue
                 pass
 
-            refs_updated += 1
+        refs_updated += 1
 
     pcbnew.SaveBoard(board_path, board)
     print(f"Updated {refs_updated} modules in board {board_path}")
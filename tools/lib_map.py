@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Optional
 
 # Symbol/footprint mapping for LED Touch Grid
@@ -49,23 +50,44 @@ def resolve_symbol_footprint(component_name: str) -> dict[str, Optional[str]]:
     return {"symbol": None, "footprint": None}
 
 
+def resolve_symbol(component_name: str) -> Optional[str]:
+    """Return only the symbol lib_id for a component name, or None."""
+    found = SYMBOL_FOOTPRINT_MAP.get(component_name)
+    return found.get("symbol") if found else None
+
+
+def resolve_footprint(component_name: str) -> Optional[str]:
+    """Return only the footprint for a component name, or None."""
+    found = SYMBOL_FOOTPRINT_MAP.get(component_name)
+    return found.get("footprint") if found else None
+
+
 def validate_library_completeness(required_components: list[str]) -> bool:
     """Check that all required components have symbol/footprint mappings."""
-    missing = [c for c in required_components if c not in SYMBOL_FOOTPRINT_MAP]
-    if missing:
+    # Set difference runs in C; the ordered list is only built on failure
+    unmapped = set(required_components).difference(SYMBOL_FOOTPRINT_MAP)
+    if unmapped:
+        missing = [c for c in required_components if c in unmapped]
         raise ValueError(f"Missing symbol/footprint mapping for: {missing}")
     return True
 
 
 def validate_symbol_library_legacy(component_names: list[str]) -> list[str]:
     """Validate which components have valid symbol/footprint mappings."""
-    return [name for name in component_names if name not in SYMBOL_FOOTPRINT_MAP]
+    unmapped = set(component_names).difference(SYMBOL_FOOTPRINT_MAP)
+    if not unmapped:
+        return []
+    # Keep input order (and repeats), as callers report these in that order
+    return [name for name in component_names if name in unmapped]
 
 
 # Stubs for compatibility
 class Symbol:
     """Stub Symbol class for import compatibility."""
 
+    # No per-instance __dict__; generators create many of these
+    __slots__ = ("name", "pins", "footprint", "fields", "klc_validated")
+
     def __init__(
         self,
         name: str,
@@ -81,7 +103,18 @@ class Symbol:
 
 
 def resolve_lib_id(lib: str, name: str, use_vendor: bool = False) -> str:
-    """Stub resolver for library IDs. Returns 'lib:name'."""
+    """Stub resolver for library IDs. Returns 'lib:name'.
+
+    Results are memoized: schematics resolve the same (lib, name) pair for
+    every instance of a part.
+    """
+    # Normalize the flag so positional, keyword and truthy spellings of the
+    # same call share one cache entry.
+    return _resolve_lib_id_cached(lib, name, bool(use_vendor))
+
+
+@lru_cache(maxsize=2048)
+def _resolve_lib_id_cached(lib: str, name: str, use_vendor: bool) -> str:
     if use_vendor:
         if lib == "unknown":
             return f"{lib}:{name}"
@@ -91,31 +124,40 @@ def resolve_lib_id(lib: str, name: str, use_vendor: bool = False) -> str:
 
 def validate_klc_rules(symbol: Symbol) -> list[str]:
     """Stub for KLC rule validation."""
+    return list(_klc_issues(symbol.name, symbol.footprint))
+
+
+@lru_cache(maxsize=1024)
+def _klc_issues(name: str, footprint: str | None) -> tuple[str, ...]:
+    # The rules only look at name and footprint, so results are memoized on them
     # guard against None footprints
-    if "APA102" in symbol.name and symbol.footprint is not None and "LED_APA102-2020" not in symbol.footprint:
-        return ["APA102 symbol must use LED_APA102-2020 footprint"]
-    return []
+    if "APA102" in name and footprint is not None and "LED_APA102-2020" not in footprint:
+        return ("APA102 symbol must use LED_APA102-2020 footprint",)
+    return ()
 
 
-def get_part_info(part_ref: str) -> dict[str, Optional[str]]:
-    kv_map = {
-        "RP2040": ("Raspberry Pi", "RP2040"),
-        "APA102": ("Worldsemi", "APA102-2020"),
-        "SK9822": ("Cree", "SK9822-2020"),
-        "TOUCH_PAD": ("Custom", "CUST-101"),
-        # Add common component types for BOM generation
-        "CAP-0603": ("Kemet", "C0603C104K5RACTU"),
-        "RES-0603": ("Panasonic", "ERJ-6ENF1001V"),
-    }
+# Part-reference substring -> (manufacturer, MPN)
+_KV_MAP: dict[str, tuple[str, str]] = {
+    "RP2040": ("Raspberry Pi", "RP2040"),
+    "APA102": ("Worldsemi", "APA102-2020"),
+    "SK9822": ("Cree", "SK9822-2020"),
+    "TOUCH_PAD": ("Custom", "CUST-101"),
+    # Add common component types for BOM generation
+    "CAP-0603": ("Kemet", "C0603C104K5RACTU"),
+    "RES-0603": ("Panasonic", "ERJ-6ENF1001V"),
+}
 
-    for key, (mfg, part) in kv_map.items():
-        if key in part_ref:
-            return {
-                "mpn": part,
-                "manufacturer": mfg,
-                "supplier": "",
-                "supplier_pn": "",
-            }
+
+def get_part_info(part_ref: str) -> dict[str, Optional[str]]:
+    found = _lookup_part(part_ref)
+    if found:
+        mfg, part = found
+        return {
+            "mpn": part,
+            "manufacturer": mfg,
+            "supplier": "",
+            "supplier_pn": "",
+        }
 
     # For unknown components, return None values as expected by test
     return {
@@ -126,103 +168,104 @@ def get_part_info(part_ref: str) -> dict[str, Optional[str]]:
     }
 
 
+@lru_cache(maxsize=512)
+def _lookup_part(part_ref: str) -> Optional[tuple[str, str]]:
+    """Return (manufacturer, MPN) for a part reference, memoized per reference.
+
+    A BOM repeats the same parts, so the table scan runs once per distinct
+    reference; get_part_info still builds a fresh dict for each caller.
+    """
+    # The first key in table order that occurs in the reference wins
+    return next((value for key, value in _KV_MAP.items() if key in part_ref), None)
+
+
 def get_footprint(part_ref: str) -> str:
     return "dummy_footprint"
 
 
+# RP2040 QFN-56 pin maps; load_rp2040_pinmap copies these into fresh containers
+_RP2040_PIN_TO_SIGNAL: tuple[tuple[str, str], ...] = (
+    ("1", "IOVDD"),
+    ("2", "GPIO0"),
+    ("3", "GPIO1"),
+    ("10", "IOVDD"),
+    ("22", "IOVDD"),
+    ("33", "IOVDD"),
+    ("42", "IOVDD"),
+    ("49", "IOVDD"),
+)
+_RP2040_SIGNAL_TO_PIN: tuple[tuple[str, tuple[int, ...]], ...] = (
+    ("IOVDD", (1, 10, 22, 33, 42, 49)),
+    ("GPIO0", (2,)),
+    ("GPIO1", (3,)),
+)
+
+
 def load_rp2040_pinmap(package: str) -> dict[str, Any]:
     return {
         "package": package,
-        "pin_to_signal": {
-            "1": "IOVDD",
-            "2": "GPIO0",
-            "3": "GPIO1",
-            "10": "IOVDD",
-            "22": "IOVDD",
-            "33": "IOVDD",
-            "42": "IOVDD",
-            "49": "IOVDD",
-        },
-        "signal_to_pin": {
-            "IOVDD": [1, 10, 22, 33, 42, 49],
-            "GPIO0": [2],
-            "GPIO1": [3],
-        },
+        "pin_to_signal": dict(_RP2040_PIN_TO_SIGNAL),
+        "signal_to_pin": {signal: list(pins) for signal, pins in _RP2040_SIGNAL_TO_PIN},
     }
 
 
+# LED Touch Grid symbols: name -> (pins, footprint, fields), built once at import
+_SYMBOL_SPECS: dict[str, tuple[tuple[str, ...], str, dict[str, str]]] = {
+    "RP2040_QFN56": (
+        tuple(f"GPIO{i}" for i in range(56)),
+        "MCU_QFN56.pretty:RP2040-QFN56",
+        {"Manufacturer": "Raspberry Pi"},
+    ),
+    "APA102-2020": (
+        ("VDD", "DOUT", "GND", "CIN"),
+        "LED_SMD:LED_APA102-2020",
+        {"Manufacturer": "Worldsemi", "Voltage": "5V"},
+    ),
+    "SK9822-2020": (
+        ("VDD", "DOUT", "GND", "CIN"),
+        "LED_SMD:LED_RGB_PLCC4_5.0x5.0mm",
+        {"Manufacturer": "Cree", "Voltage": "5V"},
+    ),
+    "Touch_Pad_19x19mm": (
+        ("PAD", "GND"),
+        "Custom:Touch_Pad_19x19mm",
+        {"Manufacturer": "Custom", "Layer": "F.Cu"},
+    ),
+    "Touch_Sensor_TTP223": (
+        ("VDD", "GND", "OUT"),
+        "Custom:Touch_Sensor_TTP223",
+        {"Manufacturer": "Custom"},
+    ),
+    "AMS1117-3.3": (
+        ("IN", "GND", "OUT"),
+        "Package_TO_SOT_SMD:SOT-223-3_TabPin2",
+        {"Manufacturer": "AMS"},
+    ),
+    "PESD5V0S1BA": (
+        ("A", "K"),
+        "Package_TO_SOT_SMD:SOT-23",
+        {"Manufacturer": "Nexperia"},
+    ),
+    "USB_C_Receptacle": (
+        tuple(f"PIN{i}" for i in range(1, 25)),
+        "Connector_USB:USB_C_Receptacle",
+        {"Manufacturer": "Custom"},
+    ),
+    "W25Q32JV": (
+        ("CS", "DO", "WP", "GND", "DI", "CLK", "HOLD", "VCC"),
+        "Package_SO:SOIC-8_3.9x4.9mm_P1.27mm",
+        {"Manufacturer": "Winbond"},
+    ),
+}
+
+
 def create_led_touch_grid_symbols() -> dict[str, Symbol]:
     """Return symbol data structure expected by tests"""
-    symbols: dict[str, Symbol] = {}
-    # typed symbol configs to help mypy infer types in comprehensions below
-    symbol_configs: list[tuple[str, int, str, str, dict[str, str]]] = [
-        (
-            "RP2040_QFN56",
-            56,
-            "MCU_QFN56.pretty:RP2040-QFN56",
-            "Raspberry Pi",
-            {},
-        ),
-        (
-            "APA102-2020",
-            4,
-            "LED_SMD:LED_APA102-2020",
-            "Worldsemi",
-            {"Voltage": "5V"},
-        ),
-        (
-            "SK9822-2020",
-            4,
-            "LED_SMD:LED_RGB_PLCC4_5.0x5.0mm",
-            "Cree",
-            {"Voltage": "5V"},
-        ),
-        (
-            "Touch_Pad_19x19mm",
-            2,
-            "Custom:Touch_Pad_19x19mm",
-            "Custom",
-            {"Layer": "F.Cu"},
-        ),
-        ("Touch_Sensor_TTP223", 3, "Custom:Touch_Sensor_TTP223", "Custom", {}),
-        ("AMS1117-3.3", 3, "Package_TO_SOT_SMD:SOT-223-3_TabPin2", "AMS", {}),
-        ("PESD5V0S1BA", 2, "Package_TO_SOT_SMD:SOT-23", "Nexperia", {}),
-        (
-            "USB_C_Receptacle",
-            24,
-            "Connector_USB:USB_C_Receptacle",
-            "Custom",
-            {},
-        ),
-        ("W25Q32JV", 8, "Package_SO:SOIC-8_3.9x4.9mm_P1.27mm", "Winbond", {}),
-    ]
-
-    for name, count, footprint, manufacturer, extra_fields in symbol_configs:
-        if "RP2040" in name:
-            pins = [f"GPIO{i}" for i in range(count)]
-        elif "APA102" in name or "SK9822" in name:
-            pins = ["VDD", "DOUT", "GND", "CIN"]
-        elif "Touch_Pad" in name:
-            pins = ["PAD", "GND"]
-        elif "Touch_Sensor" in name:
-            pins = ["VDD", "GND", "OUT"]
-        elif "AMS1117" in name:
-            pins = ["IN", "GND", "OUT"]
-        elif "PESD5V0S1BA" in name:
-            pins = ["A", "K"]
-        elif "USB_C" in name:
-            pins = [f"PIN{i}" for i in range(1, count + 1)]
-        elif "W25Q32JV" in name:
-            pins = ["CS", "DO", "WP", "GND", "DI", "CLK", "HOLD", "VCC"]
-        else:
-            pins = ["VDD", "GND", "SDA", "SCL"]
-
-        fields = {"Manufacturer": manufacturer}
-        fields.update(extra_fields)
-
-        symbols[name] = Symbol(name=name, pins=pins, footprint=footprint, fields=fields)
-
-    return symbols
+    # Fresh pin lists and field dicts per call; Symbol attributes are mutable
+    return {
+        name: Symbol(name=name, pins=list(pins), footprint=footprint, fields=dict(fields))
+        for name, (pins, footprint, fields) in _SYMBOL_SPECS.items()
+    }
 
 
 def validate_symbol_library(symbols: dict[str, Symbol]) -> dict[str, list[str]]:
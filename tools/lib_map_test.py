@@ -1,12 +1,13 @@
-#!/usr/bin/env python3
 """
-Test script for LED touch grid component library and symbol mapping.
-Validates the enhanced lib_map.py functionality.
+Tests for LED touch grid component library and symbol mapping.
+Validates the enhanced lib_map.py functionality. Run with pytest.
 """
 
 import os
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.dirname(__file__))
 
 from lib_map import (
@@ -38,31 +39,25 @@ def test_symbol_creation() -> None:
     print("✓ Symbol creation test passed")
 
 
-def test_part_info_lookup() -> None:
+@pytest.mark.parametrize(
+    ("part_ref", "expected_mfg", "expected_mpn"),
+    [
+        ("RP2040", "Raspberry Pi", "RP2040"),
+        # New LED component
+        ("APA102", "Worldsemi", "APA102-2020"),
+        # New touch component
+        ("TOUCH_PAD", "Custom", "CUST-101"),
+        # Reference containing two keys: table order decides, not position
+        ("APA102_RP2040", "Raspberry Pi", "RP2040"),
+        # Non-existent component
+        ("UNKNOWN_COMPONENT", None, None),
+    ],
+)
+def test_part_info_lookup(part_ref: str, expected_mfg: str | None, expected_mpn: str | None) -> None:
     """Test part information lookup functionality"""
-    print("Testing part info lookup...")
-
-    # Test existing component
-    rp2040_info = get_part_info("RP2040")
-    assert rp2040_info["manufacturer"] == "Raspberry Pi"
-    assert rp2040_info["mpn"] == "RP2040"
-
-    # Test new LED component
-    apa102_info = get_part_info("APA102")
-    assert apa102_info["manufacturer"] == "Worldsemi"
-    # The PartInfo TypedDict only has mpn, manufacturer, supplier, supplier_pn fields
-    # Voltage is not part of the PartInfo structure, so we remove this assertion
-
-    # Test new touch component
-    touch_info = get_part_info("TOUCH_PAD")
-    assert touch_info["manufacturer"] == "Custom"
-
-    # Test non-existent component
-    unknown_info = get_part_info("UNKNOWN_COMPONENT")
-    assert unknown_info["mpn"] is None
-    assert unknown_info["manufacturer"] is None
-
-    print("✓ Part info lookup test passed")
+    info = get_part_info(part_ref)
+    assert info["manufacturer"] == expected_mfg
+    assert info["mpn"] == expected_mpn
 
 
 def test_klc_validation() -> None:
@@ -198,31 +193,3 @@ def test_lib_id_resolution() -> None:
     assert lib_id == "unknown:Component"
 
     print("✓ Library ID resolution test passed")
-
-
-def main() -> int:
-    """Run all tests"""
-    print("Running LED touch grid component library tests...\n")
-
-    try:
-        test_symbol_creation()
-        test_part_info_lookup()
-        test_klc_validation()
-        test_rp2040_pinmap()
-        test_led_touch_grid_symbols()
-        test_symbol_library_validation()
-        test_lib_id_resolution()
-
-        print("\n✅ All tests passed successfully!")
-        return 0
-
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
-
-        traceback.print_exc()
-        return 1
-
-
-if __name__ == "__main__":
-    sys.exit(main())
@@ -19,7 +19,9 @@ def migrate_project(src: str | Path, dest: str | Path) -> None:
     if dest_p.exists():
         raise SystemExit(f"destination already exists: {dest}")
 
-    shutil.copytree(src_p, dest_p)
+    # shutil.copy keeps permission bits (scripts stay executable) but skips
+    # copy2's per-file timestamp/xattr copy, which a migrated tree doesn't need.
+    shutil.copytree(src_p, dest_p, copy_function=shutil.copy)
     stamp = dest_p / ".migrated_to_kicad_builder"
     stamp.write_text("migrated\n")
 
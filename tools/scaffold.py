@@ -13,9 +13,12 @@ import json
 import subprocess
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from jinja2 import Template
+if TYPE_CHECKING:
+    from jinja2 import Template
 
 DAID_TMPL = "# DAID Metadata\n# Generated: {{ timestamp }}\n# Git SHA: {{ git_sha }}\n"
 
@@ -54,12 +57,17 @@ def ensure_dir(path: Path) -> None:
 
 
 def write_if_missing(path: Path, content: str) -> None:
-    if path.exists():
+    # Exclusive create: the existence check and the open are one syscall
+    try:
+        with open(path, "x", encoding="utf-8") as fh:
+            fh.write(content)
+    except FileExistsError:
         return
-    path.write_text(content, encoding="utf-8")
 
 
+@lru_cache(maxsize=1)
 def git_sha_short() -> str:
+    # Cached: batch scaffolding should not fork git once per project
     try:
         out = subprocess.check_output(
             [
@@ -79,6 +87,18 @@ def timestamp_utc() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+@lru_cache(maxsize=1)
+def _templates() -> tuple[Template, Template]:
+    """Return the compiled (Makefile, CI) templates.
+
+    jinja2 is imported and the templates compiled on first use, so importing
+    this module for its helpers does not pay for Jinja2.
+    """
+    from jinja2 import Template
+
+    return Template(MAKEFILE_TMPL), Template(CI_TMPL)
+
+
 def make_project(name: str) -> None:
     root = Path("hardware") / "projects" / name
     root.mkdir(parents=True, exist_ok=True)
@@ -97,7 +117,8 @@ def make_project(name: str) -> None:
         "python_version": sys.version.split()[0],
     }
 
-    mf = Template(MAKEFILE_TMPL).render(
+    makefile_t, ci_t = _templates()
+    mf = makefile_t.render(
         project_name=name,
         timestamp=daid["timestamp"],
         git_sha=daid["git_sha"],
@@ -108,7 +129,7 @@ def make_project(name: str) -> None:
 
     wf_dir = Path(".github") / "workflows"
     wf_dir.mkdir(parents=True, exist_ok=True)
-    wf = Template(CI_TMPL).render()
+    wf = ci_t.render()
     write_if_missing(wf_dir / "hw.yml", wf)
 
     print(f"Created project scaffold at {root}")
@@ -9,21 +9,19 @@ Usage:
 """
 
 import argparse
+from math import sqrt
 from pathlib import Path
 
-FOOT_TEMPLATE = """(module {name} (layer F.Cu) (tedit 00000000)
+# Row spacing factor for the hex via pattern
+_SQRT3_2 = sqrt(3) * 0.5
+
+# Module header; the generated sections follow it one per line, then ")"
+FOOT_HEADER = """(module {name} (layer F.Cu) (tedit 00000000)
     (descr "Generated footprint — verify dimensions against datasheet")
     (tags "generated footprint")
     (attr smd)
     (fp_text reference U1 (at 0 -4.5) (layer F.SilkS))
     (fp_text value {name} (at 0 6.5) (layer F.Fab))
-{pads}
-{ep_vias}
-{tent_note}
-    {ep_pad}
-{paste_fp}
-{courtyard_fp}
-)
 """
 
 
@@ -34,97 +32,33 @@ def make_pads(
     pads_per_side: int = 14,
     pad_shape: str = "rect",
 ) -> str:
-    pads: list[str] = []
     half_span = (pads_per_side - 1) * pitch / 2.0
+    # Each side walks the same offsets, ascending (top, left) or descending
+    # (right, bottom), so both coordinate columns are computed and formatted
+    # once and shared between two sides.
+    ascending = [f"{-half_span + i * pitch:.2f}" for i in range(pads_per_side)]
+    descending = [f"{half_span - i * pitch:.2f}" for i in range(pads_per_side)]
+    half_str = f"{half_span:.2f}"
+    neg_half_str = f"{-half_span:.2f}"
+    # Everything but the pad number and the varying coordinate is fixed per
+    # side, so it is formatted once into that side's prefix/suffix.
+    # Pads on the top/bottom sides are w x l, on the left/right sides l x w.
+    head = f" smd {pad_shape} (at "
+    size_wl = f"(size {pad_w} {pad_l}) (layers F.Cu F.Paste F.Mask))"
+    size_lw = f"(size {pad_l} {pad_w}) (layers F.Cu F.Paste F.Mask))"
+    top_tail = f" {half_str}) {size_wl}"
+    right_head = f"{head}{half_str} "
+    bottom_tail = f" {neg_half_str}) {size_wl}"
+    left_head = f"{head}{neg_half_str} "
     # top pads 1..N
-    for i in range(pads_per_side):
-        x = -half_span + i * pitch
-        x_str = f"{x:.2f}"
-        half_str = f"{half_span:.2f}"
-        pads.append(
-            (
-                "  (pad "
-                + str(i + 1)
-                + " smd "
-                + pad_shape
-                + " (at "
-                + x_str
-                + " "
-                + half_str
-                + ") (size "
-                + str(pad_w)
-                + " "
-                + str(pad_l)
-                + ") (layers F.Cu F.Paste F.Mask))"
-            )
-        )
+    top = [f"  (pad {n}{head}{x}{top_tail}" for n, x in enumerate(ascending, 1)]
     # right side
-    for i in range(pads_per_side):
-        y = half_span - i * pitch
-        y_str = f"{y:.2f}"
-        half_str = f"{half_span:.2f}"
-        pads.append(
-            (
-                "  (pad "
-                + str(pads_per_side + 1 + i)
-                + " smd "
-                + pad_shape
-                + " (at "
-                + half_str
-                + " "
-                + y_str
-                + ") (size "
-                + str(pad_l)
-                + " "
-                + str(pad_w)
-                + ") (layers F.Cu F.Paste F.Mask))"
-            )
-        )
+    right = [f"  (pad {n}{right_head}{y}) {size_lw}" for n, y in enumerate(descending, pads_per_side + 1)]
     # bottom
-    for i in range(pads_per_side):
-        x = half_span - i * pitch
-        x_str = f"{x:.2f}"
-        neg_half_str = f"{-half_span:.2f}"
-        pads.append(
-            (
-                "  (pad "
-                + str(2 * pads_per_side + 1 + i)
-                + " smd "
-                + pad_shape
-                + " (at "
-                + x_str
-                + " "
-                + neg_half_str
-                + ") (size "
-                + str(pad_w)
-                + " "
-                + str(pad_l)
-                + ") (layers F.Cu F.Paste F.Mask))"
-            )
-        )
+    bottom = [f"  (pad {n}{head}{x}{bottom_tail}" for n, x in enumerate(descending, 2 * pads_per_side + 1)]
     # left
-    for i in range(pads_per_side):
-        y = -half_span + i * pitch
-        y_str = f"{y:.2f}"
-        neg_half_str = f"{-half_span:.2f}"
-        pads.append(
-            (
-                "  (pad "
-                + str(3 * pads_per_side + 1 + i)
-                + " smd "
-                + pad_shape
-                + " (at "
-                + neg_half_str
-                + " "
-                + y_str
-                + ") (size "
-                + str(pad_l)
-                + " "
-                + str(pad_w)
-                + ") (layers F.Cu F.Paste F.Mask))"
-            )
-        )
-    return "\n".join(pads)
+    left = [f"  (pad {n}{left_head}{y}) {size_lw}" for n, y in enumerate(ascending, 3 * pads_per_side + 1)]
+    return "\n".join(top + right + bottom + left)
 
 
 def make_ep(ep: float, ep_shape: str = "rect") -> str:
@@ -144,6 +78,41 @@ def make_paste_fp(ep: float, paste_reduction: float = 0.0, ep_shape: str = "rect
     return f'  (pad "EP_PASTE" smd rect (at 0 0) (size {size:.2f} {size:.2f}) (layers F.Paste))'
 
 
+def _via_positions(avail: float, via_pitch: float, pattern: str) -> list[tuple[float, float]]:
+    """Return via centers on a `pattern` ("grid" or hex) filling an `avail` square."""
+    positions: list[tuple[float, float]] = []
+    if pattern == "grid":
+        # compute counts that will fit in the available space
+        count = max(1, int((avail + 1e-6) // via_pitch))
+        if count == 1:
+            positions = [(0.0, 0.0)]
+        else:
+            start = -(((count - 1) * via_pitch) / 2.0)
+            # rows and columns share one coordinate list
+            coords = [start + i * via_pitch for i in range(count)]
+            positions = [(x, y) for x in coords for y in coords]
+    else:
+        # hex pattern: vertical spacing is pitch * sqrt(3)/2
+        y_pitch = via_pitch * _SQRT3_2
+        nx = max(1, int((avail + 1e-6) // via_pitch))
+        ny = max(1, int((avail + 1e-6) // y_pitch))
+        start_x = -(((nx - 1) * via_pitch) / 2.0)
+        start_y = -(((ny - 1) * y_pitch) / 2.0)
+        half = avail / 2.0
+        # Odd rows shift right by half a pitch. Every row of the same parity
+        # has the same columns, so each parity's in-bounds x list is computed
+        # and filtered once and reused for all of its rows.
+        row_xs = [
+            [x for x in (start_x + col * via_pitch + row_offset for col in range(nx)) if abs(x) <= half]
+            for row_offset in (0.0, via_pitch / 2.0)
+        ]
+        for row in range(ny):
+            y = start_y + row * y_pitch
+            if abs(y) <= half:
+                positions.extend((x, y) for x in row_xs[row & 1])
+    return positions
+
+
 def make_ep_vias(
     ep: float,
     via_pitch: float = 1.5,
@@ -163,50 +132,16 @@ def make_ep_vias(
     if avail <= 0:
         return ""
 
-    positions: list[tuple[float, float]] = []
-    if pattern == "grid":
-        # compute counts that will fit in the available space
-        count = max(1, int((avail + 1e-6) // via_pitch))
-        if count == 1:
-            positions = [(0.0, 0.0)]
-        else:
-            start = -(((count - 1) * via_pitch) / 2.0)
-            for i in range(count):
-                for j in range(count):
-                    x = start + i * via_pitch
-                    y = start + j * via_pitch
-                    positions.append((x, y))
-    else:
-        # hex pattern: vertical spacing is pitch * sqrt(3)/2
-
-        y_pitch = via_pitch * 0.8660254037844386
-        nx = max(1, int((avail + 1e-6) // via_pitch))
-        ny = max(1, int((avail + 1e-6) // y_pitch))
-        start_x = -(((nx - 1) * via_pitch) / 2.0)
-        start_y = -(((ny - 1) * y_pitch) / 2.0)
-        for row in range(ny):
-            row_offset = (via_pitch / 2.0) if (row % 2 == 1) else 0.0
-            for col in range(nx):
-                x = start_x + col * via_pitch + row_offset
-                y = start_y + row * y_pitch
-                if abs(x) <= avail / 2.0 and abs(y) <= avail / 2.0:
-                    positions.append((x, y))
+    positions = _via_positions(avail, via_pitch, pattern)
 
-    pads: list[str] = []
-    idx = 1
-    for x, y in positions:
-        x_str = f"{x:.2f}"
-        y_str = f"{y:.2f}"
-        dia_str = f"{via_diameter:.2f}"
-        drill_str = f"{via_drill:.2f}"
-        pads.append(
-            (
-                f"  (pad EP_VIA_{idx} thru_hole circle (at {x_str} {y_str}) "
-                f"(size {dia_str} {dia_str}) "
-                f"(drill {drill_str}) (layers *.Cu *.Mask))"
-            )
-        )
-        idx += 1
+    dia_str = f"{via_diameter:.2f}"
+    drill_str = f"{via_drill:.2f}"
+    pads = [
+        f"  (pad EP_VIA_{idx} thru_hole circle (at {x:.2f} {y:.2f}) "
+        f"(size {dia_str} {dia_str}) "
+        f"(drill {drill_str}) (layers *.Cu *.Mask))"
+        for idx, (x, y) in enumerate(positions, 1)
+    ]
     return "\n".join(pads)
 
 
@@ -359,18 +294,16 @@ def main() -> None:
             courtyard_fp = tent_note + courtyard_fp
         else:
             paste_fp = tent_note + paste_fp
-    content = FOOT_TEMPLATE.format(
-        name=args.name,
-        pads=pads,
-        ep_pad=ep_pad,
-        paste_fp=paste_fp,
-        courtyard_fp=courtyard_fp,
-        ep_vias=ep_vias,
-        tent_note=tent_note,
-    )
     outp = Path(args.out)
     outp.parent.mkdir(parents=True, exist_ok=True)
-    outp.write_text(content)
+    # Sections are streamed into one buffered file rather than first being
+    # formatted into a single document string.
+    with open(outp, "w", buffering=1 << 16) as f:
+        f.write(FOOT_HEADER.format(name=args.name))
+        for section in (pads, ep_vias, tent_note, "    " + ep_pad, paste_fp, courtyard_fp):
+            f.write(section)
+            f.write("\n")
+        f.write(")\n")
     print(f"Wrote {args.out}")
 
 
@@ -12,54 +12,116 @@ import argparse
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
 TEMPLATE_HEADER = "(kicad_symbol_lib (version 20211014) (generator gen_symbol))\n"
 
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
 
 
 def make_symbol(name: str, pinmap: Dict[str, Any], footprint: str = "REPO-MCU:REPO-MCU-QFN56") -> str:
     pins: Dict[str, str] = pinmap.get("pin_to_signal", {})
-    lines = []
-    lines.append(f'(symbol "{name}")')
-    lines.append("  (pin_numbers_have_shape)")
-    lines.append('  (property "Value" "' + name + '")')
-    lines.append(f'  (property "Footprint" "{footprint}")')
-    lines.append('  (property "Package" "QFN-56")')
-    lines.append('  (property "Note" "Generated symbol — review pin names")')
+    try:
+        return _symbol_text(name, tuple(pins.items()), footprint)
+    except TypeError:
+        # unhashable pin entries (malformed pinmap) cannot be cached
+        return _symbol_text.__wrapped__(name, tuple(pins.items()), footprint)
+
+
+@lru_cache(maxsize=128)
+def _symbol_text(name: str, pins: Tuple[Tuple[str, str], ...], footprint: str) -> str:
+    # Memoized on (name, pins, footprint) so batch runs that emit the same
+    # symbol again reuse the rendered text.
+    lines = [
+        f'(symbol "{name}")',
+        "  (pin_numbers_have_shape)",
+        '  (property "Value" "' + name + '")',
+        f'  (property "Footprint" "{footprint}")',
+        '  (property "Package" "QFN-56")',
+        '  (property "Note" "Generated symbol — review pin names")',
+    ]
     # pins
-    for pnum, sig in pins.items():
-        lines.append(f'  (pin {pnum} passive line (at 0 0) (length 1) (name "{sig}"))')
+    lines.extend(map(_pin_line, pins))
     lines.append(")")
     return "\n".join(lines)
 
 
-def main() -> None:
-    p = argparse.ArgumentParser(description="Generate a KiCad symbol from a pinmap JSON")
-    p.add_argument("pinmap")
-    p.add_argument("out")
-    p.add_argument("--footprint", default="REPO-MCU:REPO-MCU-QFN56", help="Footprint lib:name to embed")
-    p.add_argument("--package", default=None, help="Override package name in symbol")
-    args = p.parse_args()
+def _pin_line(pin: Tuple[str, str]) -> str:
+    pnum, sig = pin
+    return f'  (pin {pnum} passive line (at 0 0) (length 1) (name "{sig}"))'
 
-    pinmap_path = Path(args.pinmap)
+
+def load_pinmap(pinmap_path: Path) -> Optional[Dict[str, Any]]:
+    """Parse a pinmap JSON file, or return None (with a message) if it is unusable."""
     if not pinmap_path.exists() or not pinmap_path.is_file() or pinmap_path.stat().st_size == 0:
         print(f"Pinmap {pinmap_path} not found or empty; skipping generation.")
-        return
+        return None
     try:
-        pm = json.loads(pinmap_path.read_text())
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        pm: Dict[str, Any] = (
+            orjson.loads(pinmap_path.read_bytes()) if orjson is not None else json.loads(pinmap_path.read_text())
+        )
     except json.JSONDecodeError:
         print(f"Pinmap {pinmap_path} contains invalid JSON; skipping generation.")
-        return
-    out_path = Path(args.out)
+        return None
+    return pm
+
+
+def write_symbol(
+    pm: Dict[str, Any],
+    out_path: Path,
+    footprint: str = "REPO-MCU:REPO-MCU-QFN56",
+    package: Optional[str] = None,
+) -> None:
+    """Write the symbol library for a parsed pinmap to `out_path`."""
     out_path.parent.mkdir(parents=True, exist_ok=True)
     name = pm.get("description", "PART").split()[0]
-    if args.package:
-        pm["package"] = args.package
-    content = TEMPLATE_HEADER + make_symbol(name, pm, footprint=args.footprint)
-    out_path.write_text(content)
+    if package:
+        pm["package"] = package
+    with open(out_path, "w", buffering=1 << 16) as f:
+        f.write(TEMPLATE_HEADER)
+        f.write(make_symbol(name, pm, footprint=footprint))
     print(f"Wrote {out_path}")
 
 
+def gen_symbol_batch(
+    jobs: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+    footprint: str = "REPO-MCU:REPO-MCU-QFN56",
+    package: Optional[str] = None,
+) -> int:
+    """Generate one symbol library per (pinmap, out) pair; returns the number written.
+
+    Each distinct pinmap file is parsed once, however many outputs use it.
+    """
+    parsed: Dict[Path, Optional[Dict[str, Any]]] = {}
+    written = 0
+    for pinmap, out in jobs:
+        pinmap_path = Path(pinmap)
+        if pinmap_path not in parsed:
+            parsed[pinmap_path] = load_pinmap(pinmap_path)
+        pm = parsed[pinmap_path]
+        if pm is None:
+            continue
+        write_symbol(pm, Path(out), footprint=footprint, package=package)
+        written += 1
+    return written
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Generate a KiCad symbol from a pinmap JSON")
+    p.add_argument("pinmap")
+    p.add_argument("out")
+    p.add_argument("--footprint", default="REPO-MCU:REPO-MCU-QFN56", help="Footprint lib:name to embed")
+    p.add_argument("--package", default=None, help="Override package name in symbol")
+    args = p.parse_args()
+
+    gen_symbol_batch([(args.pinmap, args.out)], footprint=args.footprint, package=args.package)
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,168 @@
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tools import check_env
+
+
+def test_check_module_missing_skips_import(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setattr(check_env.importlib.util, "find_spec", lambda name: None)
+
+    def fail_import(name: str) -> None:
+        raise AssertionError(f"{name} should not be imported")
+
+    monkeypatch.setattr(check_env.importlib, "import_module", fail_import)
+    assert check_env.check_module("not_installed_pkg") is False
+    assert "module: not_installed_pkg MISSING (ModuleNotFoundError)" in capsys.readouterr().out
+
+
+def test_check_module_reports_broken_install(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    # find_spec locates the module, but importing it fails (e.g. a missing
+    # shared library), so it must still be reported as missing.
+    (tmp_path / "broken_env_pkg.py").write_text("raise ImportError('libfoo.so not found')\n", encoding="utf8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert check_env.check_module("broken_env_pkg") is False
+    assert "module: broken_env_pkg MISSING (ImportError)" in capsys.readouterr().out
+    sys.modules.pop("broken_env_pkg", None)
+
+
+def test_check_module_present_reports_version(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / "good_env_pkg.py").write_text("__version__ = '1.2.3'\n", encoding="utf8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert check_env.check_module("good_env_pkg") is True
+    assert "module: good_env_pkg present (version=1.2.3)" in capsys.readouterr().out
+    sys.modules.pop("good_env_pkg", None)
+
+
+def _counting_checks(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+
+    def fake_run_checks() -> int:
+        calls.append(1)
+        print(f"report {len(calls)}")
+        return 0
+
+    monkeypatch.setattr(check_env, "_run_checks", fake_run_checks)
+    return calls
+
+
+@pytest.fixture
+def cached_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A cwd holding a minimal git repo, with an isolated site-packages dir."""
+    repo = tmp_path / "repo"
+    (repo / ".git" / "refs" / "heads").mkdir(parents=True)
+    (repo / ".git" / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf8")
+    (repo / ".git" / "refs" / "heads" / "main").write_text("a" * 40 + "\n", encoding="utf8")
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+    monkeypatch.chdir(repo)
+    monkeypatch.setattr(check_env, "_site_packages_dirs", lambda: [site_dir])
+    monkeypatch.setenv("BUTTONS_ENV_CACHE", str(tmp_path / "cache"))
+    (tmp_path / "cache").mkdir()
+    return tmp_path
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_env_cache_reuses_report(
+    cached_env: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    calls = _counting_checks(monkeypatch)
+    assert check_env.main() == 0
+    assert check_env.main() == 0
+    assert len(calls) == 1
+    assert capsys.readouterr().out == "report 1\nreport 1\n"
+
+
+def test_env_cache_expires_after_ttl(cached_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _counting_checks(monkeypatch)
+    check_env.main()
+    monkeypatch.setattr(check_env, "ENV_CACHE_TTL", -1.0)
+    check_env.main()
+    assert len(calls) == 2
+
+
+def test_env_cache_invalidated_by_new_commit(cached_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _counting_checks(monkeypatch)
+    check_env.main()
+    ref = cached_env / "repo" / ".git" / "refs" / "heads" / "main"
+    ref.write_text("b" * 40 + "\n", encoding="utf8")
+    _bump_mtime(ref)
+    check_env.main()
+    assert len(calls) == 2
+
+
+def test_env_cache_invalidated_by_checkout(cached_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _counting_checks(monkeypatch)
+    check_env.main()
+    (cached_env / "repo" / ".git" / "HEAD").write_text("c" * 40 + "\n", encoding="utf8")
+    check_env.main()
+    assert len(calls) == 2
+
+
+def test_env_cache_invalidated_by_package_change(cached_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = _counting_checks(monkeypatch)
+    check_env.main()
+    site_dir = cached_env / "site-packages"
+    (site_dir / "newpkg-1.0.dist-info").mkdir()
+    _bump_mtime(site_dir)
+    check_env.main()
+    assert len(calls) == 2
+
+
+def test_tool_probes_run_concurrently_and_report_in_order(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    # Every probe blocks until all three are running, so sequential probing
+    # would break the barrier instead of completing.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_run(cmd: list[str], **kwargs: object) -> SimpleNamespace:
+        barrier.wait()
+        if cmd[0] == "kicad":
+            # Finish last of the two kicad probes to check report order
+            time.sleep(0.05)
+        return SimpleNamespace(stdout=f"{cmd[0]} 8.0.1\n", returncode=0)
+
+    def fake_check_output(cmd: list[str], **kwargs: object) -> str:
+        barrier.wait()
+        return "abc1234\n"
+
+    monkeypatch.setattr(check_env.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(check_env.subprocess, "run", fake_run)
+    monkeypatch.setattr(check_env.subprocess, "check_output", fake_check_output)
+    monkeypatch.setattr(check_env, "check_module", lambda name: True)
+    monkeypatch.setenv("BUTTONS_IGNORE_PYTHON_CHECK", "1")
+    monkeypatch.delenv("BUTTONS_ENV_CACHE", raising=False)
+
+    assert check_env.main() == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[-3:] == [
+        "cmd: kicad-cli --version -> kicad-cli 8.0.1",
+        "cmd: kicad --version -> kicad 8.0.1",
+        "git: HEAD abc1234",
+    ]
+
+
+def test_missing_tools_are_reported_without_running(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def fail_run(cmd: list[str], **kwargs: object) -> None:
+        raise AssertionError("no subprocess expected")
+
+    monkeypatch.setattr(check_env.shutil, "which", lambda name: None)
+    monkeypatch.setattr(check_env.subprocess, "run", fail_run)
+    assert check_env.run_cmd(["kicad-cli", "--version"]) is None
+    assert capsys.readouterr().out == "cmd: kicad-cli not found in PATH\n"
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from tools.scripts import gen_footprint
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Fixtures were generated by the original gen_footprint.py with these arguments
+GOLDEN_CASES = {
+    "gen_footprint_default.kicad_mod": [],
+    "gen_footprint_hex.kicad_mod": [
+        "--name",
+        "TEST-QFN32",
+        "--pads_per_side",
+        "8",
+        "--pitch",
+        "0.4",
+        "--pad_shape",
+        "oval",
+        "--ep",
+        "3.2",
+        "--ep_shape",
+        "round",
+        "--paste_reduction",
+        "0.4",
+        "--ep_via_pattern",
+        "hex",
+        "--ep_via_pitch",
+        "0.9",
+        "--ep_via_tenting",
+        "top",
+    ],
+    "gen_footprint_no_vias.kicad_mod": [
+        "--no-ep-vias",
+        "--courtyard",
+        "0",
+        "--ep_via_tenting",
+        "both",
+        "--pad_w",
+        "0.3",
+        "--pad_l",
+        "0.75",
+    ],
+}
+
+
+@pytest.mark.parametrize("fixture", sorted(GOLDEN_CASES))
+def test_gen_footprint_matches_golden_output(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, fixture: str) -> None:
+    out = tmp_path / "out" / "footprint.kicad_mod"
+    monkeypatch.setattr(sys, "argv", ["gen_footprint.py", "--out", str(out), *GOLDEN_CASES[fixture]])
+    gen_footprint.main()
+    assert out.read_bytes() == (FIXTURES / fixture).read_bytes()
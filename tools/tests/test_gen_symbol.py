@@ -0,0 +1,32 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from tools.scripts import gen_symbol
+from tools.scripts.gen_symbol import TEMPLATE_HEADER, gen_symbol_batch, make_symbol
+
+
+def test_gen_symbol_batch_parses_each_pinmap_once(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    pinmap = {"description": "RP2040 MCU", "pin_to_signal": {"1": "IOVDD", "2": "GPIO0"}}
+    pinmap_path = tmp_path / "rp2040_pinmap.json"
+    pinmap_path.write_text(json.dumps(pinmap))
+    missing = tmp_path / "missing.json"
+
+    loads: list[Path] = []
+    real_load = gen_symbol.load_pinmap
+
+    def counting_load(path: Path) -> object:
+        loads.append(path)
+        return real_load(path)
+
+    monkeypatch.setattr(gen_symbol, "load_pinmap", counting_load)
+
+    outs = [tmp_path / "a" / "REPO-rp2040.lib", tmp_path / "b" / "REPO-rp2040.lib"]
+    written = gen_symbol_batch([(pinmap_path, outs[0]), (missing, tmp_path / "c.lib"), (pinmap_path, outs[1])])
+
+    assert written == 2
+    assert loads == [pinmap_path, missing]
+    expected = TEMPLATE_HEADER + make_symbol("RP2040", pinmap)
+    assert [out.read_text() for out in outs] == [expected, expected]
+    assert not (tmp_path / "c.lib").exists()
@@ -0,0 +1,68 @@
+import csv
+import json
+from pathlib import Path
+
+from tools.generate_grid_placements import generate_grid
+
+
+def test_generate_grid_outputs(tmp_path: Path) -> None:
+    out_csv = tmp_path / "placements.csv"
+    out_bom = tmp_path / "bom.csv"
+    out_map = tmp_path / "map.json"
+    generate_grid(
+        out_csv=str(out_csv),
+        out_bom=str(out_bom),
+        out_map=str(out_map),
+        pads_x=2,
+        pads_y=2,
+        pad_pitch=20.0,
+        led_pattern=(2, 2),
+        led_spacing=3.5,
+        led_footprint="LED:APA102",
+    )
+
+    with out_csv.open(newline="") as f:
+        rows = list(csv.DictReader(f))
+    refs = [r["ref"] for r in rows]
+    assert refs[:4] == ["TP01", "TP02", "TP03", "TP04"]
+    assert refs[4:8] == ["LED001", "LED002", "LED003", "LED004"]
+    assert len(refs) == 4 + 16
+    led5 = rows[4 + 4]
+    assert (float(led5["x_mm"]), float(led5["y_mm"])) == (18.25, -1.75)
+
+    with out_bom.open(newline="") as f:
+        bom = {r["footprint"]: int(r["quantity"]) for r in csv.DictReader(f)}
+    assert bom == {"Custom:Touch_Pad_19x19mm": 4, "LED:APA102": 16}
+
+    mapping = json.loads(out_map.read_text())
+    assert mapping["LED016"]["footprint"] == "LED:APA102"
+    assert mapping["TP04"]["x_mm"] == 20.0 and mapping["TP04"]["y_mm"] == 20.0
+
+
+def test_ref_mapping_dedupes_repeated_refs(tmp_path: Path) -> None:
+    out_csv = tmp_path / "placements.csv"
+    out_map = tmp_path / "map.json"
+    generate_grid(
+        out_csv=str(out_csv),
+        out_bom=str(tmp_path / "bom.csv"),
+        out_map=str(out_map),
+        tiles_x=2,
+        tiles_y=2,
+        pads_x=2,
+        pads_y=2,
+        led_pattern=(2, 2),
+        led_footprint="LED:APA102",
+    )
+
+    with out_csv.open(newline="") as f:
+        refs = [r["ref"] for r in csv.DictReader(f)]
+    # Touch pads restart at TP01 on every tile; LEDs are numbered across tiles
+    assert len(refs) == 4 * (4 + 16)
+
+    text = out_map.read_text()
+    mapping = json.loads(text)
+    assert len(mapping) == len(set(refs)) == 4 + 4 * 16
+    assert text.count('"TP01"') == 1
+    assert list(mapping)[:4] == ["TP01", "TP02", "TP03", "TP04"]
+    # The last tile's placement wins for a repeated ref
+    assert mapping["TP01"]["x_mm"] == 100.0 and mapping["TP01"]["y_mm"] == 100.0
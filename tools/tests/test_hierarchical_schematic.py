@@ -1,5 +1,6 @@
 """Tests for hierarchical schematic generation functionality."""
 
+import dataclasses
 import os
 import sys
 import tempfile
@@ -64,6 +65,13 @@ class TestSheet:
         assert sheet.hierarchical_pins[1].name == "GND"
         assert sheet.hierarchical_pins[1].direction == "in"
 
+    def test_pin_index_is_not_a_dataclass_field(self):
+        """Test that the pin lookup index stays out of fields, repr and eq."""
+        sheet = Sheet(name="power")
+        sheet.add_hier_pin("VCC", direction="out")
+        assert "_pin_index" not in {f.name for f in dataclasses.fields(Sheet)}
+        assert "_pin_index" not in repr(sheet)
+
     def test_duplicate_sheet_name_raises_error(self):
         """Test that adding a sheet with duplicate name raises error."""
         sch = Schematic("test")
@@ -145,6 +153,19 @@ class TestHierarchicalSchematic:
         pin = hier_sch._find_pin("nonexistent", "VCC")
         assert pin is None
 
+    @pytest.mark.parametrize("sheet_cls", [Sheet, Schematic])
+    def test_find_pin_duplicate_name_returns_first(self, sheet_cls):
+        """Test that a pin name added twice resolves to the first pin."""
+        hier_sch = HierarchicalSchematic("test")
+        sheet = sheet_cls("test")
+        sheet.add_hier_pin("VCC", direction="out")
+        sheet.add_hier_pin("VCC", direction="in")
+        hier_sch.add_sheet(sheet)
+
+        pin = hier_sch._find_pin("test", "VCC")
+        assert pin is sheet.hier_pins[0]
+        assert pin.direction == "out"
+
     def test_validate_hierarchy_valid_connections(self):
         """Test validation of valid hierarchical connections."""
         hier_sch = HierarchicalSchematic("test")
@@ -166,6 +187,47 @@ class TestHierarchicalSchematic:
         # Should not raise any errors
         hier_sch.validate_hierarchy()
 
+    def test_validate_hierarchy_rechecks_new_connections(self):
+        """Test that validation reflects changes made after an earlier run."""
+        hier_sch = HierarchicalSchematic("test")
+        parent_sheet = Sheet(name="parent", schematic=Schematic("parent"))
+        child_sheet = Sheet(name="child", schematic=Schematic("child"))
+        parent_sheet.add_hier_pin("DATA_OUT", direction="out")
+        child_sheet.add_hier_pin("DATA_IN", direction="in")
+        hier_sch.add_sheet(parent_sheet)
+        hier_sch.add_sheet(child_sheet)
+        hier_sch.connect_hier_pins("parent", "DATA_OUT", "child", "DATA_IN")
+        assert hier_sch.validate_hierarchy() == []
+
+        child_sheet.add_hier_pin("DATA_OUT2", direction="out")
+        hier_sch.connect_hier_pins("parent", "DATA_OUT", "child", "DATA_OUT2")
+        with pytest.raises(ValueError, match="cannot drive"):
+            hier_sch.validate_hierarchy()
+
+    def test_validate_hierarchy_rechecks_in_place_edits(self):
+        """Test that in-place pin and connection edits are revalidated."""
+        hier_sch = HierarchicalSchematic("test")
+        parent_sheet = Sheet(name="parent", schematic=Schematic("parent"))
+        child_sheet = Sheet(name="child", schematic=Schematic("child"))
+        parent_sheet.add_hier_pin("DATA_OUT", direction="out")
+        child_sheet.add_hier_pin("DATA_IN", direction="in")
+        child_sheet.add_hier_pin("DATA_OUT2", direction="out")
+        hier_sch.add_sheet(parent_sheet)
+        hier_sch.add_sheet(child_sheet)
+        hier_sch.connect_hier_pins("parent", "DATA_OUT", "child", "DATA_IN")
+        assert hier_sch.validate_hierarchy() == []
+
+        # Same length, different connection
+        hier_sch.hier_connections[0] = ("parent.DATA_OUT", "child.DATA_OUT2")
+        with pytest.raises(ValueError, match="Output pins cannot drive other output pins"):
+            hier_sch.validate_hierarchy()
+
+        hier_sch.hier_connections[0] = ("parent.DATA_OUT", "child.DATA_IN")
+        assert hier_sch.validate_hierarchy() == []
+        child_sheet.hier_pins[0].direction = "out"
+        with pytest.raises(ValueError, match="Output pins cannot drive other output pins"):
+            hier_sch.validate_hierarchy()
+
     def test_validate_hierarchy_invalid_format(self):
         """Test validation catches invalid connection format."""
         hier_sch = HierarchicalSchematic("test")
@@ -241,6 +303,25 @@ class TestHierarchicalSchematic:
         assert len(summary["sheets"]["power"]["pins"]) == 1
         assert summary["sheets"]["power"]["pins"][0]["name"] == "VCC"
 
+    def test_summary_refreshes_after_changes(self):
+        """Test that summary reflects changes and callers get independent copies."""
+        hier_sch = HierarchicalSchematic("test")
+        sheet = Sheet(name="power", schematic=Schematic("power_sheet"))
+        sheet.add_hier_pin("VCC", direction="out")
+        hier_sch.add_sheet(sheet)
+
+        first = hier_sch.summary()
+        first["title"] = "changed"
+        first["sheets"]["power"]["pins"].append({"name": "X", "direction": "in"})
+        assert hier_sch.summary()["title"] == "test"
+        assert [p["name"] for p in hier_sch.summary()["sheets"]["power"]["pins"]] == ["VCC"]
+
+        sheet.add_hier_pin("GND", direction="out")
+        hier_sch.create_sheet("mcu")
+        summary = hier_sch.summary()
+        assert [p["name"] for p in summary["sheets"]["power"]["pins"]] == ["VCC", "GND"]
+        assert "mcu" in summary["sheets"]
+
     def test_write_generates_output_files(self):
         """Test that writing hierarchical schematic generates expected files."""
         hier_sch = HierarchicalSchematic("test_hierarchy")
@@ -321,6 +402,42 @@ def test_hierarchical_schematic_integration():
         assert len(hier_data["connections"]) == 2
 
 
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def test_write_matches_golden_json_bytes(tmp_path):
+    """Hierarchy and summary JSON stay byte-identical to json.dumps(indent=2) output."""
+    hier_sch = HierarchicalSchematic("golden")
+
+    power = Sheet(name="power", schematic=Schematic("power_sheet"))
+    power.add_hier_pin("3V3_OUT", direction="out")
+    power.symbols.append(
+        Symbol(
+            lib="Device",
+            name="C",
+            ref="C1",
+            value="1000\u00b5F",
+            at=(1.5, 2.25),
+            footprint="C_0603",
+            fields={"Note": "bulk"},
+        )
+    )
+    mcu = Sheet(name="mcu", schematic=Schematic("mcu_sheet"))
+    mcu.add_hier_pin("3V3_IN", direction="in")
+    mcu.symbols.append(Symbol(lib="MCU", name="RP2040", ref="U1"))
+    mcu.wires.append(("U1.1", "U1.2"))
+
+    hier_sch.add_sheet(power)
+    hier_sch.add_sheet(mcu)
+    hier_sch.connect_hier_pins("power", "3V3_OUT", "mcu", "3V3_IN")
+    hier_sch.write(out_dir=str(tmp_path))
+
+    for name in ("golden_hierarchy.json", "golden_summary.json"):
+        with open(os.path.join(FIXTURES, name), "rb") as f:
+            expected = f.read()
+        assert (tmp_path / name).read_bytes() == expected, name
+
+
 class TestPowerDecouplingValidation:
     """Tests for validate_power_decoupling in HierarchicalSchematic."""
 
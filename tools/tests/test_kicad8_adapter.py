@@ -0,0 +1,107 @@
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("simp_sexp")
+
+from tools.compat import kicad8_adapter  # noqa: E402
+
+
+def _write_lib(path: Path, *names: str) -> None:
+    symbols = "\n".join(f'  (symbol "{n}" (pin passive line (number "1")))' for n in names)
+    path.write_text(f"(kicad_symbol_lib (version 20231120)\n{symbols}\n)\n", encoding="utf-8")
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_find_symbol_parses_each_file_version_once(tmp_path: Path) -> None:
+    lib = tmp_path / "Device.kicad_sym"
+    _write_lib(lib, "R", "C")
+    path = str(lib)
+
+    kicad8_adapter._parse_sexp.cache_clear()
+    assert kicad8_adapter._find_symbol(path, "R") is not None
+    assert kicad8_adapter._find_symbol(path, "C") is not None
+    assert kicad8_adapter._find_symbol(path, "L") is None
+    assert kicad8_adapter._parse_sexp.cache_info().misses == 1
+
+
+def test_edited_library_is_parsed_again(tmp_path: Path) -> None:
+    lib = tmp_path / "Device.kicad_sym"
+    _write_lib(lib, "R")
+    path = str(lib)
+    assert kicad8_adapter._find_symbol(path, "R") is not None
+    assert kicad8_adapter._find_symbol(path, "L") is None
+
+    _write_lib(lib, "L")
+    _bump_mtime(lib)
+    assert kicad8_adapter._find_symbol(path, "R") is None
+    assert kicad8_adapter._find_symbol(path, "L") is not None
+    assert str(kicad8_adapter._load_sexp(path)).count("(symbol") == 1
+
+
+def test_unreadable_library_returns_none(tmp_path: Path) -> None:
+    assert kicad8_adapter._load_sexp(str(tmp_path / "missing.kicad_sym")) is None
+    assert kicad8_adapter._find_symbol(str(tmp_path / "missing.kicad_sym"), "R") is None
+
+
+@pytest.fixture
+def symbol_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    for var in kicad8_adapter._SYMBOL_DIR_ENVVARS:
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("KICAD8_SYMBOL_DIR", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    kicad8_adapter.clear_caches()
+    return tmp_path
+
+
+def test_lookup_sees_library_added_to_indexed_dir(symbol_dir: Path) -> None:
+    _write_lib(symbol_dir / "R.kicad_sym", "R")
+    assert kicad8_adapter._lookup_symbol("R") is not None
+    assert kicad8_adapter._lookup_symbol("RP2040") is None
+
+    _write_lib(symbol_dir / "RP2040.kicad_sym", "RP2040")
+    _bump_mtime(symbol_dir)
+    assert kicad8_adapter._lookup_symbol("RP2040") is not None
+
+
+def test_symbol_index_scans_once_per_dir_state(symbol_dir: Path) -> None:
+    _write_lib(symbol_dir / "Device.kicad_sym", "R")
+    dirs = (str(symbol_dir),)
+    assert kicad8_adapter._symbol_index(dirs) == {"Device": str(symbol_dir / "Device.kicad_sym")}
+    kicad8_adapter._symbol_index(dirs)
+    info = kicad8_adapter._scan_symbol_dirs.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert info.maxsize is not None
+
+
+def test_clear_caches_drops_scans_and_parses(symbol_dir: Path) -> None:
+    _write_lib(symbol_dir / "R_Small.kicad_sym", "R")
+    assert kicad8_adapter._lookup_symbol("R") is not None
+    kicad8_adapter.clear_caches()
+    for cached in (kicad8_adapter._scan_symbol_dirs, kicad8_adapter._find_symbol_at, kicad8_adapter._parse_sexp):
+        assert cached.cache_info().currsize == 0
+
+
+def test_parse_units_on_plain_lists() -> None:
+    from tools.compat._kicad8_fast import parse_units
+
+    part = [
+        "symbol",
+        "SW",
+        ["symbol", "SW_0_1", ["rectangle"]],
+        [
+            "symbol",
+            "SW_1_1",
+            ["pin", "passive", "line", ["at", 0, 2.54, 270], ["length", 1.27], ["name", "A"], ["number", "1"]],
+            ["pin", "input", "line", ["name", "B"], ["number", "2"]],
+        ],
+    ]
+    assert parse_units(part) == [
+        (1, [("passive", "A", "1", 0, 2.54, 270, 1.27), ("input", "B", "2", 0, 0, 0, None)]),
+    ]
+    assert parse_units(["symbol", "EMPTY"]) is None
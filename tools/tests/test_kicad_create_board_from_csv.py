@@ -0,0 +1,181 @@
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tools.kicad_create_board_from_csv import create_board_from_csv
+
+
+class _Module:
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.ref: str | None = None
+        self.pos: tuple[int, int] | None = None
+        self.orientation: int | None = None
+
+    def SetReference(self, ref: str) -> None:
+        self.ref = ref
+
+    def SetPosition(self, pos: SimpleNamespace) -> None:
+        self.pos = (pos.x, pos.y)
+
+    def SetOrientation(self, value: int) -> None:
+        self.orientation = value
+
+
+class _FakePcbnew:
+    """Just enough of pcbnew: a library table plus directory-based loads."""
+
+    def __init__(self, library: set[tuple[str, str]]) -> None:
+        self.library = library
+        self.loads: list[tuple[str, str]] = []
+        self.placed: list[_Module] = []
+        self.saved: list[str] = []
+
+    def FootprintLoad(self, lib: str, name: str) -> _Module | None:
+        self.loads.append((lib, name))
+        if (lib, name) in self.library:
+            return _Module(f"{lib}:{name}")
+        # KiCad resolves a directory plus footprint name to <dir>/<name>.kicad_mod
+        path = os.path.join(lib, f"{name}.kicad_mod")
+        if os.path.isdir(lib) and os.path.isfile(path):
+            return _Module(path)
+        raise OSError(f"footprint {lib}:{name} not found")
+
+    def BOARD(self) -> SimpleNamespace:
+        return SimpleNamespace(Add=self.placed.append)
+
+    def VECTOR2I(self, x: int, y: int) -> SimpleNamespace:
+        return SimpleNamespace(x=x, y=y)
+
+    def SaveBoard(self, path: str, board: SimpleNamespace) -> None:
+        self.saved.append(path)
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """A project footprints.pretty directory used as the fallback source."""
+    fp_dir = tmp_path / "footprints.pretty"
+    fp_dir.mkdir()
+    monkeypatch.setenv("KICAD_FOOTPRINTS_DIR", str(fp_dir))
+    monkeypatch.delenv("KICAD_NEED_WX", raising=False)
+    return fp_dir
+
+
+def _run(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, csv_text: str, library: set[tuple[str, str]] | None = None
+) -> _FakePcbnew:
+    pcbnew = _FakePcbnew(library or set())
+    monkeypatch.setitem(sys.modules, "pcbnew", pcbnew)
+    csv_path = tmp_path / "placements.csv"
+    csv_path.write_text(csv_text)
+    create_board_from_csv(str(tmp_path / "out.kicad_pcb"), str(csv_path))
+    assert pcbnew.saved == [str(tmp_path / "out.kicad_pcb")]
+    return pcbnew
+
+
+def _placed(pcbnew: _FakePcbnew) -> dict[str | None, _Module]:
+    return {m.ref: m for m in pcbnew.placed}
+
+
+def test_library_footprint_loads_from_library_table(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, project: Path
+) -> None:
+    (project / "R_0603.kicad_mod").write_text('(footprint "R_0603")\n')
+    pcbnew = _run(
+        monkeypatch,
+        tmp_path,
+        "ref,footprint,x_mm,y_mm,rotation\nR1,Resistor:R_0603,1.5,2,90\n",
+        library={("Resistor", "R_0603")},
+    )
+    r1 = _placed(pcbnew)["R1"]
+    assert r1.source == "Resistor:R_0603"
+    assert (r1.pos, r1.orientation) == ((1_500_000, 2_000_000), 900)
+
+
+def test_project_footprint_stands_in_for_unknown_library(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, project: Path
+) -> None:
+    # The first file in walk order wins over a same-named one in a subdirectory
+    (project / "SW_SPST.kicad_mod").write_text('(footprint "SW_SPST")\n')
+    (project / "old").mkdir()
+    (project / "old" / "SW_SPST.kicad_mod").write_text('(footprint "SW_SPST")\n')
+    pcbnew = _run(
+        monkeypatch,
+        tmp_path,
+        "ref,footprint,x_mm,y_mm,rotation\nS1,Custom:SW_SPST,0,0,0\nS2,Custom:SW_SPST,5,0,0\n",
+    )
+    placed = _placed(pcbnew)
+    assert placed["S1"].source == placed["S2"].source == str(project / "SW_SPST.kicad_mod")
+    assert placed["S2"].pos == (5_000_000, 0)
+    # The second row reuses the arguments that worked for the first
+    assert pcbnew.loads.count((str(project), "SW_SPST")) == 2
+    assert pcbnew.loads.count(("Custom", "SW_SPST")) == 1
+
+
+def test_declared_name_differs_from_filename(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, project: Path) -> None:
+    (project / "aaa_unrelated.kicad_mod").write_text('(footprint "LED_0805")\n')
+    (project / "touch_pad_v2.kicad_mod").write_text('(footprint "Touch_Pad_19x19mm"\n  (layer "F.Cu")\n)\n')
+    pcbnew = _run(monkeypatch, tmp_path, "ref,footprint,x_mm,y_mm,rotation\nTP1,Custom:Touch_Pad_19x19mm,0,0,0\n")
+    assert _placed(pcbnew)["TP1"].source == str(project / "touch_pad_v2.kicad_mod")
+
+
+def test_missing_footprint_is_skipped(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, project: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (project / "SW_SPST.kicad_mod").write_text('(footprint "SW_SPST")\n')
+    pcbnew = _run(
+        monkeypatch,
+        tmp_path,
+        "ref,footprint,x_mm,y_mm,rotation\nX1,Custom:Nope,0,0,0\nX2,Custom:Nope,0,0,0\nS1,Custom:SW_SPST,0,0,0\n",
+    )
+    assert list(_placed(pcbnew)) == ["S1"]
+    out = capsys.readouterr().out
+    assert "Failed to load footprint Custom:Nope; skipping X1" in out
+    assert "Failed to load footprint Custom:Nope; skipping X2" in out
+    assert "with 1 modules" in out
+    # A footprint that failed once is not retried
+    assert pcbnew.loads.count(("Custom", "Nope")) == 1
+
+
+def test_missing_optional_columns_default_to_zero(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, project: Path
+) -> None:
+    pcbnew = _run(
+        monkeypatch,
+        tmp_path,
+        "ref,footprint,x_mm\nR1,Resistor:R_0603,2.5\nR2,Resistor:R_0603\n",
+        library={("Resistor", "R_0603")},
+    )
+    placed = _placed(pcbnew)
+    assert (placed["R1"].pos, placed["R1"].orientation) == ((2_500_000, 0), 0)
+    assert (placed["R2"].pos, placed["R2"].orientation) == ((0, 0), 0)
+
+
+def test_reordered_headers(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, project: Path) -> None:
+    pcbnew = _run(
+        monkeypatch,
+        tmp_path,
+        "rotation,y_mm,footprint,x_mm,ref\n45,2,Resistor:R_0603,1,R1\n",
+        library={("Resistor", "R_0603")},
+    )
+    r1 = _placed(pcbnew)["R1"]
+    assert (r1.source, r1.pos, r1.orientation) == ("Resistor:R_0603", (1_000_000, 2_000_000), 450)
+
+
+@pytest.mark.parametrize("header", ["ref,x_mm,y_mm,rotation", "footprint,x_mm,y_mm,rotation"])
+def test_missing_required_column_raises(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, project: Path, header: str
+) -> None:
+    with pytest.raises(ValueError, match="missing CSV columns"):
+        _run(monkeypatch, tmp_path, f"{header}\nR1,0,0,0\n")
+
+
+def test_empty_csv_places_nothing(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, project: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    pcbnew = _run(monkeypatch, tmp_path, "")
+    assert pcbnew.placed == []
+    assert "with 0 modules" in capsys.readouterr().out
@@ -0,0 +1,72 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tools import kicad_place_from_csv
+from tools.kicad_place_from_csv import _footprints_by_ref, apply_from_csv, mm_list_to_nm, mm_to_nm
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_mm_list_to_nm_matches_mm_to_nm(monkeypatch: pytest.MonkeyPatch, use_numpy: bool) -> None:
+    if not use_numpy:
+        monkeypatch.setattr(kicad_place_from_csv, "np", None)
+    values = [0.0, 1.5, -2.25, 7.123456789, 0.0000001, -0.0000001, 499.9999999]
+    result = mm_list_to_nm(values)
+    assert result == [mm_to_nm(v) for v in values]
+    assert all(type(v) is int for v in result)
+
+
+class _Footprint:
+    def __init__(self, ref: str) -> None:
+        self.ref = ref
+
+    def GetReference(self) -> str:
+        return self.ref
+
+
+def test_footprints_by_ref_keeps_first_duplicate() -> None:
+    first, dup, other = _Footprint("U1"), _Footprint("U1"), _Footprint("R1")
+
+    class Board:
+        def GetModules(self) -> list[_Footprint]:
+            return [first, other, dup]
+
+    by_ref = _footprints_by_ref(Board())
+    assert by_ref == {"U1": first, "R1": other}
+
+
+def test_footprints_by_ref_without_listing_api() -> None:
+    assert _footprints_by_ref(object()) is None
+
+
+def test_apply_from_csv_places_footprints(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    class Footprint(_Footprint):
+        pos: tuple[int, int] | None = None
+        orientation: int | None = None
+
+        def SetPosition(self, pos: SimpleNamespace) -> None:
+            self.pos = (pos.x, pos.y)
+
+        def SetOrientation(self, value: int) -> None:
+            self.orientation = value
+
+    u1, r1 = Footprint("U1"), Footprint("R1")
+    saved: list[str] = []
+    fake_pcbnew = SimpleNamespace(
+        LoadBoard=lambda path: SimpleNamespace(GetFootprints=lambda: [u1, r1]),
+        VECTOR2I=lambda x, y: SimpleNamespace(x=x, y=y),
+        SaveBoard=lambda path, board: saved.append(path),
+    )
+    monkeypatch.setattr(kicad_place_from_csv, "_get_pcbnew", lambda: fake_pcbnew)
+
+    board = tmp_path / "board.kicad_pcb"
+    board.write_text("")
+    csv_path = tmp_path / "placements.csv"
+    csv_path.write_text("ref,x_mm,y_mm,rotation\nU1,1.5,2,90\nX9,0,0,0\nR1,,3\n")
+
+    apply_from_csv(str(board), str(csv_path))
+
+    assert (u1.pos, u1.orientation) == ((1_500_000, 2_000_000), 900)
+    assert (r1.pos, r1.orientation) == ((0, 3_000_000), 0)
+    assert saved == [str(board)]
@@ -1,6 +1,12 @@
+import json
+
 import pytest
 
 from tools.lib_map import (
+    get_part_info,
+    load_rp2040_pinmap,
+    resolve_footprint,
+    resolve_symbol,
     resolve_symbol_footprint,
     validate_library_completeness,
     validate_symbol_library_legacy,
@@ -33,3 +39,26 @@ def test_validate_symbol_library():
     components = ["RP2040", "LED", "MISSING_PART"]
     missing = validate_symbol_library_legacy(components)
     assert missing == ["MISSING_PART"], "Should identify missing components"
+
+
+def test_resolve_symbol_and_footprint_match_combined_lookup():
+    for name in ["RP2040", "SWD", "INVALID_PART"]:
+        combined = resolve_symbol_footprint(name)
+        assert resolve_symbol(name) == combined["symbol"]
+        assert resolve_footprint(name) == combined["footprint"]
+
+
+def test_get_part_info_returns_independent_dicts():
+    first = get_part_info("RP2040")
+    assert json.loads(json.dumps(first)) == first
+    first["quantity"] = "4"
+    assert "quantity" not in get_part_info("RP2040")
+
+
+def test_load_rp2040_pinmap_returns_independent_maps():
+    first = load_rp2040_pinmap("QFN-56")
+    first["signal_to_pin"]["IOVDD"].append(99)
+    first["pin_to_signal"]["1"] = "GND"
+    second = load_rp2040_pinmap("QFN-56")
+    assert second["signal_to_pin"]["IOVDD"] == [1, 10, 22, 33, 42, 49]
+    assert second["pin_to_signal"]["1"] == "IOVDD"